@@ -1,5 +1,20 @@
-import os
+import os, json
 import httpx
+from typing import Iterator
+
+# orjson decodes and encodes faster when it is installed; the stdlib
+# json module is the fallback
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 
 class LMStudioAdapter:
     def __init__(self, base_url: str | None = None, model: str | None = None, timeout: int = 30):
@@ -7,14 +22,21 @@ class LMStudioAdapter:
         self.base_url = base_url or os.getenv("OPENAI_BASE", "http://localhost:11434/v1")
         self.model = model or os.getenv("MODEL_NAME", "llama3.1")  # or llama3.1:latest if you pulled that tag
         self.timeout = timeout
+        # One pooled client for the adapter's lifetime, so turns reuse the
+        # keep-alive connection instead of reconnecting for every roommate.
+        # httpx.Client is thread-safe, so concurrent roast calls can share it.
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers={
+                "Content-Type": "application/json",
+                # No auth header needed for local Ollama; keep optional if you later proxy
+            },
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
 
-    def generate(self, system_prompt: str, user_prompt: str, temperature: float, max_tokens: int) -> str:
-        url = f"{self.base_url}/chat/completions"
-        headers = {
-            "Content-Type": "application/json",
-            # No auth header needed for local Ollama; keep optional if you later proxy
-        }
-        payload = {
+    def _payload(self, system_prompt: str, user_prompt: str, temperature: float, max_tokens: int) -> dict:
+        return {
             "model": self.model,
             "temperature": temperature,
             "max_tokens": max_tokens,
@@ -23,8 +45,52 @@ class LMStudioAdapter:
                 {"role": "user", "content": user_prompt},
             ],
         }
-        with httpx.Client(timeout=self.timeout) as client:
-            r = client.post(url, headers=headers, json=payload)
-            r.raise_for_status()
-            data = r.json()
-            return data.get("choices", [{}])[0].get("message", {}).get("content", "").strip()
+
+    def generate(self, system_prompt: str, user_prompt: str, temperature: float, max_tokens: int) -> str:
+        payload = self._payload(system_prompt, user_prompt, temperature, max_tokens)
+        # Pre-encoded body; the client already sends the JSON Content-Type
+        r = self._client.post("/chat/completions", content=_dumps(payload))
+        r.raise_for_status()
+        data = _loads(r.content)
+        return data.get("choices", [{}])[0].get("message", {}).get("content", "").strip()
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 128,
+    ) -> Iterator[str]:
+        """
+        Yields incremental text chunks from the server-sent events of a
+        streamed chat completion, as they arrive.
+        """
+        payload = self._payload(system_prompt, user_prompt, temperature, max_tokens)
+        payload["stream"] = True
+        with self._client.stream("POST", "/chat/completions", content=_dumps(payload)) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                # Events look like: data: {"choices":[{"delta":{"content":"chunk"}}]}
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    obj = _loads(data)
+                except ValueError:
+                    continue
+                choices = obj.get("choices") or [{}]
+                chunk = (choices[0].get("delta") or {}).get("content")
+                if chunk:
+                    yield chunk
+
+    def close(self) -> None:
+        """Release the pooled connections."""
+        self._client.close()
+
+    def __enter__(self) -> "LMStudioAdapter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
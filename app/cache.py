@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class LLMCache:
+    """LRU cache of model responses, keyed by a hash of the request, with a per-entry TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600, path: Optional[str] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        # key -> (expiry as a wall-clock timestamp, response)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        if path:
+            self.load()
+
+    @staticmethod
+    def cache_key(**request: Any) -> str:
+        """SHA-256 of the request fields, independent of their order."""
+        blob = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        self._entries[key] = (time.time() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self) -> None:
+        """Read unexpired entries back from ``path``, if the file exists."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        for key, (expires, value) in saved.items():
+            if expires > now:
+                self._entries[key] = (expires, value)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """Write the entries to ``path`` so a restart keeps them."""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first so a crash can't leave a torn cache
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(dict(self._entries), f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
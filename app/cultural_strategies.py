@@ -7,18 +7,11 @@ contextually appropriate humor and references for different cultural backgrounds
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
 import random
 
-
-@dataclass
-class ConversationContext:
-    """Context information about the current conversation"""
-    current_topic: str
-    participants: List[str]
-    topic_history: List[str]
-    emotional_tone: str
-    thread_length: int
+# The analyzer builds the slotted ConversationContext from app.roommates;
+# strategies take that same type rather than a second copy of it
+from app.roommates import ConversationContext
 
 
 class CulturalRoastingStrategy(ABC):
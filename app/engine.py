@@ -145,6 +145,8 @@ Here is the recent conversation history:
 
         speakers = self._select_speakers(user_msg)
 
+        # Speakers are generated one after another on purpose: each prompt
+        # includes the replies added to the history by the speakers before it
         for speaker in speakers:
             # This is a simplified, non-streaming version of _generate_response_stream
             conversation_history = self._build_conversation_history()
@@ -19,18 +19,21 @@ class MemoryManager:
             roommate: The roommate to add memory to
             entry: The conversation entry to add
         """
-        roommate.conversation_memory.append(entry)
+        memory = roommate.conversation_memory
+        memory.append(entry)
         
         # Manage memory size - remove oldest entries if exceeding limit
-        if len(roommate.conversation_memory) > self.max_memory_size:
-            entries_to_remove = len(roommate.conversation_memory) - self.max_memory_size
+        if len(memory) > self.max_memory_size:
+            entries_to_remove = len(memory) - self.max_memory_size
             
             # If we have more than 10 entries, preserve the 10 most recent and 
             # remove the least effective from the older entries
-            if len(roommate.conversation_memory) > 10:
+            if len(memory) > 10:
+                entries = list(memory)
+                
                 # Keep the 10 most recent entries untouched
-                recent_entries = roommate.conversation_memory[-10:]
-                older_entries = roommate.conversation_memory[:-10]
+                recent_entries = entries[-10:]
+                older_entries = entries[:-10]
                 
                 # Sort older entries by effectiveness (lowest first for removal)
                 older_entries.sort(key=lambda x: x.effectiveness_score or 0.0)
@@ -42,11 +45,15 @@ class MemoryManager:
                 else:
                     kept_older_entries = []
                 
-                # Rebuild memory with kept older entries + recent entries
-                roommate.conversation_memory = kept_older_entries + recent_entries
+                # Rebuild memory in place with kept older entries + recent entries
+                memory.clear()
+                memory.extend(kept_older_entries)
+                memory.extend(recent_entries)
             else:
                 # If we have 10 or fewer entries, just remove the oldest
-                roommate.conversation_memory = roommate.conversation_memory[-self.max_memory_size:]
+                kept_entries = list(memory)[-self.max_memory_size:]
+                memory.clear()
+                memory.extend(kept_entries)
     
     def get_relevant_context(
         self, 
@@ -205,7 +212,7 @@ class MemoryManager:
             return []
         
         # Return the most recent entries, up to the specified number of turns
-        recent_entries = roommate.conversation_memory[-turns:]
+        recent_entries = list(roommate.conversation_memory)[-turns:]
         return recent_entries
     
     def clear_old_memories(
@@ -225,13 +232,13 @@ class MemoryManager:
         """
         cutoff_date = datetime.now() - timedelta(days=days_threshold)
         
-        original_count = len(roommate.conversation_memory)
-        roommate.conversation_memory = [
-            entry for entry in roommate.conversation_memory
-            if entry.timestamp > cutoff_date
-        ]
+        memory = roommate.conversation_memory
+        original_count = len(memory)
+        kept_entries = [entry for entry in memory if entry.timestamp > cutoff_date]
+        memory.clear()
+        memory.extend(kept_entries)
         
-        removed_count = original_count - len(roommate.conversation_memory)
+        removed_count = original_count - len(memory)
         return removed_count
     
     def get_memory_stats(self, roommate: EnhancedRoommate) -> Dict[str, Any]:
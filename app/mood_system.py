@@ -1,43 +1,125 @@
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime, timedelta
+from enum import IntEnum
+from functools import lru_cache
 import random
 from app.roommates import EnhancedRoommate
 
 
+class MoodEvent(IntEnum):
+    """Mood-affecting events. Each value indexes _MOOD_DELTA_FN."""
+    ROAST_RECEIVED = 0
+    ROAST_SUCCESSFUL = 1
+    DEFENDED = 2
+    COMPLIMENTED = 3
+    IGNORED = 4
+    PRAISED = 5
+    CRITICIZED = 6
+    SUPPORTED = 7
+
+
+# Mood delta for each MoodEvent, given the event intensity
+_MOOD_DELTA_FN = (
+    lambda i: -i,       # ROAST_RECEIVED
+    lambda i: i // 2,   # ROAST_SUCCESSFUL
+    lambda i: i,        # DEFENDED
+    lambda i: i,        # COMPLIMENTED
+    lambda i: -i // 3,  # IGNORED
+    lambda i: i,        # PRAISED
+    lambda i: -i,       # CRITICIZED
+    lambda i: i // 2,   # SUPPORTED
+)
+
+# Legacy string event names ('roast_received', ...) -> MoodEvent
+_EVENT_BY_NAME = {event.name.lower(): event for event in MoodEvent}
+
+# Aggression and humor modifiers for every mood value 0-100, using the
+# same mood bands as MoodSystem.get_mood_modifier
+_AGGRESSION_BY_MOOD = tuple(
+    1.5 if m < 30 else 1.2 if m < 50 else 0.6 if m > 80 else 0.8 if m > 60 else 1.0
+    for m in range(101)
+)
+_HUMOR_BY_MOOD = tuple(
+    0.7 if m < 30 else 0.9 if m < 50 else 1.3 if m > 80 else 1.1 if m > 60 else 1.0
+    for m in range(101)
+)
+
+
+@lru_cache(maxsize=128)
+def _describe_mood(mood: int) -> str:
+    """Mood description for a mood value; depends on the value alone."""
+    if mood >= 90:
+        return "ecstatic"
+    elif mood >= 80:
+        return "very happy"
+    elif mood >= 70:
+        return "happy"
+    elif mood >= 60:
+        return "content"
+    elif mood >= 50:
+        return "neutral"
+    elif mood >= 40:
+        return "slightly annoyed"
+    elif mood >= 30:
+        return "irritated"
+    elif mood >= 20:
+        return "angry"
+    elif mood >= 10:
+        return "furious"
+    else:
+        return "livid"
+
+
+@lru_cache(maxsize=128)
+def _roast_influence(mood: int) -> Dict[str, Any]:
+    """Roast influences for a mood value; depends on the value alone."""
+    index = max(0, min(100, mood))
+    return {
+        'should_roast_more': mood < 30,
+        'roast_intensity': _AGGRESSION_BY_MOOD[index],
+        'humor_level': _HUMOR_BY_MOOD[index],
+        'target_selection': 'enemies' if mood < 30 else 'random',
+        'response_style': 'aggressive' if mood < 30 else 'playful' if mood > 80 else 'normal'
+    }
+
+
 class MoodSystem:
     """Manages dynamic mood tracking and behavioral influence for roommates."""
     
-    def __init__(self, mood_decay_rate: float = 0.1):
+    def __init__(self, mood_decay_rate: float = 0.1, seed: Optional[int] = None):
         """
         Initialize the mood system.
         
         Args:
             mood_decay_rate: Rate at which moods decay per minute toward baseline
+            seed: Optional seed for the roast-initiation RNG (for reproducible runs)
         """
         self.mood_decay_rate = mood_decay_rate
         self.last_decay_time = datetime.now()
+        # One generator per mood system; bind its draw method once
+        self._rng = random.Random(seed)
+        self._random = self._rng.random
+        # Sub-unit decay not yet applied to each roommate's integer mood
+        self._decay_carry: Dict[str, float] = {}
     
-    def update_mood(self, roommate: EnhancedRoommate, event_type: str, intensity: int) -> None:
+    def update_mood(
+        self,
+        roommate: EnhancedRoommate,
+        event_type: Union[MoodEvent, str],
+        intensity: int
+    ) -> None:
         """
         Update roommate mood based on events.
         
         Args:
             roommate: The roommate whose mood to update
-            event_type: Type of event ('roast_received', 'roast_successful', 'defended', 'complimented')
+            event_type: A MoodEvent, or its legacy string name ('roast_received', 'defended', ...)
             intensity: Intensity of the mood change (1-10)
         """
-        mood_changes = {
-            'roast_received': -intensity,
-            'roast_successful': intensity // 2,
-            'defended': intensity,
-            'complimented': intensity,
-            'ignored': -intensity // 3,
-            'praised': intensity,
-            'criticized': -intensity,
-            'supported': intensity // 2
-        }
+        if isinstance(event_type, str):
+            event_type = _EVENT_BY_NAME.get(event_type, -1)
         
-        delta = mood_changes.get(event_type, 0)
+        delta = _MOOD_DELTA_FN[event_type](intensity) if 0 <= event_type < len(_MOOD_DELTA_FN) else 0
         
         # Apply mood change with clamping
         new_mood = max(1, min(100, roommate.mood + delta))
@@ -52,8 +134,8 @@ class MoodSystem:
             
         Returns:
             Dictionary with behavioral modifiers
-        """  
-      modifiers = {
+        """
+        modifiers = {
             'aggression': 1.0,
             'humor': 1.0,
             'defensiveness': 1.0,
@@ -100,22 +182,29 @@ class MoodSystem:
             minutes_passed: Number of minutes since last decay
         """
         decay_amount = self.mood_decay_rate * minutes_passed
+        carry = self._decay_carry
         
         for roommate in roommates:
+            name = roommate.name
             current_mood = roommate.mood
             baseline = roommate.baseline_mood
             
+            # Accumulate fractional decay so small rates still move the mood
+            pending = carry.get(name, 0.0) + decay_amount
+            step = int(pending)
+            
             if current_mood > baseline:
                 # Mood is above baseline, decay downward
-                new_mood = max(baseline, current_mood - decay_amount)
+                new_mood = max(baseline, current_mood - step)
             elif current_mood < baseline:
                 # Mood is below baseline, decay upward
-                new_mood = min(baseline, current_mood + decay_amount)
+                new_mood = min(baseline, current_mood + step)
             else:
                 # Already at baseline
                 new_mood = baseline
             
-            roommate.mood = int(new_mood)
+            carry[name] = pending - step if new_mood != baseline else 0.0
+            roommate.mood = new_mood
     
     def should_initiate_roast(self, roommate: EnhancedRoommate) -> bool:
         """
@@ -135,7 +224,7 @@ class MoodSystem:
         base_chance = (30 - roommate.mood) / 30 * 0.4
         
         # Add some randomness
-        return random.random() < base_chance   
+        return self._random() < base_chance   
  
     def get_mood_description(self, roommate: EnhancedRoommate) -> str:
         """
@@ -147,28 +236,7 @@ class MoodSystem:
         Returns:
             String describing the current mood
         """
-        mood = roommate.mood
-        
-        if mood >= 90:
-            return "ecstatic"
-        elif mood >= 80:
-            return "very happy"
-        elif mood >= 70:
-            return "happy"
-        elif mood >= 60:
-            return "content"
-        elif mood >= 50:
-            return "neutral"
-        elif mood >= 40:
-            return "slightly annoyed"
-        elif mood >= 30:
-            return "irritated"
-        elif mood >= 20:
-            return "angry"
-        elif mood >= 10:
-            return "furious"
-        else:
-            return "livid"
+        return _describe_mood(roommate.mood)
     
     def auto_decay_check(self, roommates: List[EnhancedRoommate]) -> None:
         """
@@ -196,18 +264,8 @@ class MoodSystem:
         Returns:
             Dictionary with roasting behavior influences
         """
-        mood = roommate.mood
-        modifiers = self.get_mood_modifier(roommate)
-        
-        influences = {
-            'should_roast_more': mood < 30,
-            'roast_intensity': modifiers['aggression'],
-            'humor_level': modifiers['humor'],
-            'target_selection': 'enemies' if mood < 30 else 'random',
-            'response_style': 'aggressive' if mood < 30 else 'playful' if mood > 80 else 'normal'
-        }
-        
-        return influences
+        # Copy so callers can't mutate the cached entry
+        return dict(_roast_influence(roommate.mood))
     
     def simulate_mood_event(
         self, 
@@ -4,24 +4,130 @@ Handles unique interactions between different personality types.
 """
 
 import random
-from typing import List, Dict, Any, Iterator, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from itertools import chain, islice
+from types import MappingProxyType
+from typing import List, Dict, Any, Deque, Iterator, Mapping, Optional, Tuple
 from app.roommates import EnhancedRoommate, ConversationEntry
 from app.conversation_analyzer import ConversationAnalyzer
 from datetime import datetime
 
 
+# Roommates most likely to pick up each conversation topic
+_TOPIC_PREFERENCES: Dict[str, List[str]] = {
+    "technology": ["CodeMaster"],
+    "career": ["CodeMaster", "UncleJi"],
+    "food": ["ChefCritic", "UncleJi"],
+    "entertainment": ["BeatDrop", "SavageBurn"],
+    "money": ["PennyPincher", "UncleJi"],
+    "relationships": ["UncleJi", "QuietStorm"],
+    "health": ["ChefCritic", "BeatDrop"]
+}
+
+# Fallback responders by message trait when no topic matches
+_TRAIT_PREFERENCES: Dict[str, List[str]] = {
+    "negative": ["SavageBurn", "DeepThought"],
+    "question": ["UncleJi", "CodeMaster", "DeepThought"],
+    "urgent": ["SavageBurn", "ChaosKing"]
+}
+
+# Prompt templates; the profile parts are filled once per roommate from
+# PersonalityEngine._joined_fields, the state part on every prompt
+_PERSONALITY_PRELUDE_TMPL = """You are {name}, a flatshare roommate with a very specific personality.
+
+PERSONALITY PROFILE:
+- Style: {style}
+- Background: {background}
+- Interests: {interests}
+- Speech Patterns: {speech_patterns}
+- Roast Style: {roast_style}
+
+PERSONALITY QUIRKS:
+{quirk_bullets}
+
+"""
+
+_PERSONALITY_STATE_TMPL = """CURRENT MOOD: {mood}/100 (baseline: {baseline_mood})
+ROASTING STRATEGY: {roasting_strategy}
+
+RESPONSE GUIDELINES:
+- Stay completely in character
+- Use your specific speech patterns
+- Reference your interests and background
+- Be witty but keep it PG-13
+- Make it feel like a real flatshare conversation
+- Length: 1-2 sentences maximum"""
+
+_ROASTER_PRELUDE_TMPL = """ROASTER PERSONALITY:
+- Style: {roast_signature}
+- Speech: {speech_patterns}
+- Roast Style: {roast_style}"""
+
+
 class PersonalityEngine:
     """Engine that creates personality-driven interactions between roommates."""
     
+    # Older entries fall off the front so long sessions stay bounded
+    HISTORY_LIMIT = 1024
+    
     def __init__(self, roommates: List[EnhancedRoommate], backend: Any):
         self.roommates = roommates
         self.backend = backend
         self.analyzer = ConversationAnalyzer()
-        self.interaction_history: List[ConversationEntry] = []
+        # A turn analyzes the same message several times (turn, primary
+        # response, retries); memoize the pure analysis per message
+        self._analyze = lru_cache(maxsize=256)(self.analyzer.analyze_message)
+        self.interaction_history: Deque[ConversationEntry] = deque(maxlen=self.HISTORY_LIMIT)
         
-        # Personality-specific response templates
-        self.personality_templates = self._load_personality_templates()
         self.interaction_dynamics = self._load_interaction_dynamics()
+        
+        # Dynamics indexed by roaster then target, filled in both directions;
+        # an explicit (roaster, target) entry wins over the reversed pair
+        self._dyn: Dict[str, Dict[str, str]] = {}
+        for (a, b), dynamic in self.interaction_dynamics.items():
+            self._dyn.setdefault(a, {})[b] = dynamic
+        for (a, b), dynamic in self.interaction_dynamics.items():
+            self._dyn.setdefault(b, {}).setdefault(a, dynamic)
+        
+        # Name lookups and primary-responder candidate pools, built once
+        self._by_name: Dict[str, EnhancedRoommate] = {r.name: r for r in self.roommates}
+        self._idx_by_name: Dict[str, int] = {r.name: i for i, r in enumerate(self.roommates)}
+        # One 0/1 weight per roommate slot for each topic; a turn sums the
+        # masks of its topics instead of growing a candidate list
+        self._topic_masks: Dict[str, Tuple[int, ...]] = {}
+        for topic, names in _TOPIC_PREFERENCES.items():
+            mask = [0] * len(self.roommates)
+            for n in names:
+                if n in self._idx_by_name:
+                    mask[self._idx_by_name[n]] = 1
+            if any(mask):
+                self._topic_masks[topic] = tuple(mask)
+        self._primary_pools: Dict[str, List[EnhancedRoommate]] = {
+            trait: [r for r in self.roommates if r.name in names]
+            for trait, names in _TRAIT_PREFERENCES.items()
+        }
+        self._others_of: Dict[str, List[EnhancedRoommate]] = {
+            r.name: [o for o in self.roommates if o.name != r.name]
+            for r in self.roommates
+        }
+        
+        # Static per-roommate prompt fragments, keyed by id(roommate)
+        self._prompt_cache: Dict[int, str] = {}
+        self._roaster_cache: Dict[int, str] = {}
+        self._joined: Dict[int, Dict[str, str]] = {}
+        for roommate in self.roommates:
+            self._joined_fields(roommate)
+        
+        # Built on first get_relationship_status call; the proxies track
+        # score updates, so it only needs dropping if the dicts are replaced
+        self._rel_view: Optional[Mapping[str, Mapping[str, int]]] = None
+    
+    @cached_property
+    def personality_templates(self) -> Dict[str, Dict[str, List[str]]]:
+        """Personality-specific response templates, loaded on first access."""
+        return self._load_personality_templates()
     
     def _load_personality_templates(self) -> Dict[str, Dict[str, List[str]]]:
         """Load personality-specific response templates."""
@@ -172,7 +278,7 @@ class PersonalityEngine:
             }
         }
     
-    def _load_interaction_dynamics(self) -> Dict[str, Dict[str, str]]:
+    def _load_interaction_dynamics(self) -> Dict[Tuple[str, str], str]:
         """Load specific interaction dynamics between personality pairs."""
         return {
             ("CodeMaster", "SavageBurn"): "tech_vs_social",
@@ -195,7 +301,7 @@ class PersonalityEngine:
         """Generate a personality-specific response."""
         
         # Analyze the user message
-        analysis = self.analyzer.analyze_message(user_message)
+        analysis = self._analyze(user_message)
         
         # Get personality-specific system prompt
         system_prompt = self._build_personality_prompt(roommate, analysis, context)
@@ -210,6 +316,48 @@ class PersonalityEngine:
         
         return response
     
+    def _joined_fields(self, roommate: EnhancedRoommate) -> Dict[str, str]:
+        """Join and cache a roommate's static profile fields for prompt use."""
+        context = roommate.cultural_context
+        joined = {
+            "name": roommate.name,
+            "style": roommate.style,
+            "roast_signature": roommate.roast_signature,
+            "background": context.get('background', 'general'),
+            "roast_style": context.get('roast_style', 'general'),
+            "interests": ', '.join(context.get('interests', [])),
+            "speech_patterns": ', '.join(context.get('speech_patterns', [])),
+            "quirk_bullets": '\n'.join(f'- {quirk}' for quirk in roommate.quirks),
+            "top_quirks": ', '.join(roommate.quirks[:2]),
+        }
+        self._joined[id(roommate)] = joined
+        return joined
+    
+    def _personality_prelude(self, roommate: EnhancedRoommate) -> str:
+        """Build and cache the static part of a roommate's personality prompt."""
+        joined = self._joined.get(id(roommate)) or self._joined_fields(roommate)
+        prelude = _PERSONALITY_PRELUDE_TMPL.format_map(joined)
+        self._prompt_cache[id(roommate)] = prelude
+        return prelude
+    
+    def _roaster_prelude(self, roommate: EnhancedRoommate) -> str:
+        """Build and cache the static roaster block of a roast prompt."""
+        joined = self._joined.get(id(roommate)) or self._joined_fields(roommate)
+        prelude = _ROASTER_PRELUDE_TMPL.format_map(joined)
+        self._roaster_cache[id(roommate)] = prelude
+        return prelude
+    
+    def invalidate_prompt_cache(self, roommate: Optional[EnhancedRoommate] = None) -> None:
+        """Drop cached prompt fragments after a roommate's quirks or cultural context change."""
+        if roommate is None:
+            self._prompt_cache.clear()
+            self._roaster_cache.clear()
+            self._joined.clear()
+        else:
+            self._prompt_cache.pop(id(roommate), None)
+            self._roaster_cache.pop(id(roommate), None)
+            self._joined.pop(id(roommate), None)
+    
     def _build_personality_prompt(
         self, 
         roommate: EnhancedRoommate, 
@@ -218,43 +366,28 @@ class PersonalityEngine:
     ) -> str:
         """Build a detailed personality-specific system prompt."""
         
-        base_prompt = f"""You are {roommate.name}, a flatshare roommate with a very specific personality.
-
-PERSONALITY PROFILE:
-- Style: {roommate.style}
-- Background: {roommate.cultural_context.get('background', 'general')}
-- Interests: {', '.join(roommate.cultural_context.get('interests', []))}
-- Speech Patterns: {', '.join(roommate.cultural_context.get('speech_patterns', []))}
-- Roast Style: {roommate.cultural_context.get('roast_style', 'general')}
-
-PERSONALITY QUIRKS:
-{chr(10).join(f'- {quirk}' for quirk in roommate.quirks)}
-
-CURRENT MOOD: {roommate.mood}/100 (baseline: {roommate.baseline_mood})
-ROASTING STRATEGY: {roommate.roasting_strategy}
-
-RESPONSE GUIDELINES:
-- Stay completely in character
-- Use your specific speech patterns
-- Reference your interests and background
-- Be witty but keep it PG-13
-- Make it feel like a real flatshare conversation
-- Length: 1-2 sentences maximum"""
+        prelude = self._prompt_cache.get(id(roommate)) or self._personality_prelude(roommate)
+        parts = [prelude + _PERSONALITY_STATE_TMPL.format(
+            mood=roommate.mood,
+            baseline_mood=roommate.baseline_mood,
+            roasting_strategy=roommate.roasting_strategy
+        )]
 
         if context:
-            base_prompt += f"\n\nCONTEXT: {context}"
-        
-        # Add topic-specific triggers
-        if analysis.topics:
-            relevant_triggers = []
-            for topic in analysis.topics:
-                if topic in roommate.triggers:
-                    relevant_triggers.extend(roommate.triggers[topic])
+            parts.append(f"CONTEXT: {context}")
+        
+        # Add topic-specific triggers; only the first three (in topic order)
+        # are used, so stop collecting once they're found
+        triggers = roommate.triggers
+        if analysis.topics and not triggers.keys().isdisjoint(analysis.topics):
+            relevant_triggers = list(islice(
+                chain.from_iterable(triggers[t] for t in analysis.topics if t in triggers), 3
+            ))
             
             if relevant_triggers:
-                base_prompt += f"\n\nRELEVANT TRIGGERS: {', '.join(relevant_triggers[:3])}"
+                parts.append(f"RELEVANT TRIGGERS: {', '.join(relevant_triggers)}")
         
-        return base_prompt
+        return "\n\n".join(parts)
     
     def generate_roast(
         self, 
@@ -265,39 +398,8 @@ RESPONSE GUIDELINES:
     ) -> str:
         """Generate a personality-specific roast."""
         
-        # Get roast templates for this personality
-        templates = self.personality_templates.get(roaster.name, {}).get("roast_templates", [])
+        roast_prompt = self._build_roast_prompt(roaster, target, user_message, target_roommate)
         
-        # Build roast prompt
-        roast_prompt = f"""You are {roaster.name}. Generate a single-line roast targeting {target}.
-
-ROASTER PERSONALITY:
-- Style: {roaster.roast_signature}
-- Speech: {', '.join(roaster.cultural_context.get('speech_patterns', []))}
-- Roast Style: {roaster.cultural_context.get('roast_style', 'general')}
-
-TARGET: {target}"""
-
-        if target_roommate:
-            roast_prompt += f"""
-TARGET PERSONALITY: {target_roommate.style}
-TARGET QUIRKS: {', '.join(target_roommate.quirks[:2])}"""
-            
-            # Add interaction dynamic if exists
-            interaction_key = (roaster.name, target_roommate.name)
-            reverse_key = (target_roommate.name, roaster.name)
-            
-            if interaction_key in self.interaction_dynamics:
-                roast_prompt += f"\nINTERACTION DYNAMIC: {self.interaction_dynamics[interaction_key]}"
-            elif reverse_key in self.interaction_dynamics:
-                roast_prompt += f"\nINTERACTION DYNAMIC: {self.interaction_dynamics[reverse_key]}"
-
-        roast_prompt += f"""
-
-USER MESSAGE CONTEXT: {user_message}
-
-Generate a witty, personality-appropriate roast. Keep it clever, not mean. One sentence only."""
-
         roast = self.backend.generate(
             roast_prompt,
             f"Roast {target} based on: {user_message}",
@@ -311,20 +413,43 @@ Generate a witty, personality-appropriate roast. Keep it clever, not mean. One s
         """Generate a full turn with personality-driven interactions."""
         
         responses = [f"You: {user_message}"]
+        # Entries from one turn share a single timestamp
+        turn_ts = datetime.now()
         
         # Analyze user message for context
-        analysis = self.analyzer.analyze_message(user_message)
+        analysis = self._analyze(user_message)
         
         # Choose primary responder based on message content
         primary_responder = self._choose_primary_responder(analysis)
         
-        # Generate primary response
-        primary_response = self.get_personality_response(primary_responder, user_message)
+        # Pick roasters from the other roommates and decide each target
+        # (user or primary responder) before any backend call
+        roasters, targets = self._pick_roasters(primary_responder)
+        
+        # The primary response and the roasts don't depend on each other, so
+        # the backend calls run concurrently; results are read in submission order
+        with ThreadPoolExecutor(max_workers=len(roasters) + 1) as executor:
+            primary_future = executor.submit(
+                self.get_personality_response, primary_responder, user_message
+            )
+            roast_futures = [
+                executor.submit(
+                    self.generate_roast,
+                    roaster,
+                    target,
+                    user_message,
+                    primary_responder if target == primary_responder.name else None
+                )
+                for roaster, target in zip(roasters, targets)
+            ]
+        primary_response = primary_future.result()
+        roasts = [future.result() for future in roast_futures]
+        
         responses.append(f"{primary_responder.name}: {primary_response}")
         
         # Add conversation entry to history
         self.interaction_history.append(ConversationEntry(
-            timestamp=datetime.now(),
+            timestamp=turn_ts,
             speaker="user",
             message=user_message,
             context_tags=analysis.topics,
@@ -332,29 +457,19 @@ Generate a witty, personality-appropriate roast. Keep it clever, not mean. One s
         ))
         
         self.interaction_history.append(ConversationEntry(
-            timestamp=datetime.now(),
+            timestamp=turn_ts,
             speaker=primary_responder.name,
             message=primary_response,
             context_tags=analysis.topics,
             sentiment=0.0  # Will be analyzed later
         ))
         
-        # Generate roasts from other roommates
-        potential_roasters = [r for r in self.roommates if r.name != primary_responder.name]
-        num_roasters = min(random.randint(2, 4), len(potential_roasters))
-        roasters = random.sample(potential_roasters, num_roasters)
-        
-        for roaster in roasters:
-            # Decide target (user or primary responder)
-            target = random.choice(["you", primary_responder.name])
-            target_roommate = primary_responder if target == primary_responder.name else None
-            
-            roast = self.generate_roast(roaster, target, user_message, target_roommate)
+        for roaster, roast in zip(roasters, roasts):
             responses.append(f"{roaster.name}: {roast}")
             
             # Add to history
             self.interaction_history.append(ConversationEntry(
-                timestamp=datetime.now(),
+                timestamp=turn_ts,
                 speaker=roaster.name,
                 message=roast,
                 context_tags=analysis.topics,
@@ -366,37 +481,39 @@ Generate a witty, personality-appropriate roast. Keep it clever, not mean. One s
         
         return responses
     
+    def _pick_roasters(
+        self, primary_responder: EnhancedRoommate
+    ) -> Tuple[List[EnhancedRoommate], List[str]]:
+        """Pick 2-4 roasters other than the primary responder and a target for each."""
+        pool = self._others_of.get(primary_responder.name)
+        if pool is None:
+            pool = [r for r in self.roommates if r.name != primary_responder.name]
+        k = min(random.randint(2, 4), len(pool))
+        roasters = random.sample(pool, k)
+        targets = random.choices(("you", primary_responder.name), k=k)
+        return roasters, targets
+    
     def _choose_primary_responder(self, analysis: Any) -> EnhancedRoommate:
         """Choose the most appropriate roommate to respond based on message analysis."""
         
-        # Topic-based selection
-        topic_preferences = {
-            "technology": ["CodeMaster"],
-            "career": ["CodeMaster", "UncleJi"],
-            "food": ["ChefCritic", "UncleJi"],
-            "entertainment": ["BeatDrop", "SavageBurn"],
-            "money": ["PennyPincher", "UncleJi"],
-            "relationships": ["UncleJi", "QuietStorm"],
-            "health": ["ChefCritic", "BeatDrop"]
-        }
-        
-        # Find roommates interested in the topics
-        interested_roommates = []
+        # Score roommates by how many of the message topics interest them
+        scores = None
         for topic in analysis.topics:
-            if topic in topic_preferences:
-                for name in topic_preferences[topic]:
-                    roommate = next((r for r in self.roommates if r.name == name), None)
-                    if roommate:
-                        interested_roommates.append(roommate)
+            mask = self._topic_masks.get(topic)
+            if mask is not None:
+                scores = list(mask) if scores is None else [s + m for s, m in zip(scores, mask)]
+        
+        if scores is not None:
+            return random.choices(self.roommates, weights=scores)[0]
         
         # If no topic match, choose based on personality traits
-        if not interested_roommates:
-            if analysis.sentiment < -0.5:  # Very negative
-                interested_roommates = [r for r in self.roommates if r.name in ["SavageBurn", "DeepThought"]]
-            elif analysis.question_count > 0:  # Questions
-                interested_roommates = [r for r in self.roommates if r.name in ["UncleJi", "CodeMaster", "DeepThought"]]
-            elif analysis.urgency > 0.5:  # Urgent
-                interested_roommates = [r for r in self.roommates if r.name in ["SavageBurn", "ChaosKing"]]
+        interested_roommates = None
+        if analysis.sentiment < -0.5:  # Very negative
+            interested_roommates = self._primary_pools["negative"]
+        elif analysis.question_count > 0:  # Questions
+            interested_roommates = self._primary_pools["question"]
+        elif analysis.urgency > 0.5:  # Urgent
+            interested_roommates = self._primary_pools["urgent"]
         
         # Default to random selection if no matches
         if not interested_roommates:
@@ -412,32 +529,42 @@ Generate a witty, personality-appropriate roast. Keep it clever, not mean. One s
     ):
         """Update relationship scores based on interactions."""
         
+        relationships = primary.relationships
+        
         # Positive interactions increase relationships
         if analysis.sentiment > 0.3:
             for roaster in roasters:
-                if roaster.name in primary.relationships:
-                    primary.relationships[roaster.name] = min(100, primary.relationships[roaster.name] + 2)
+                if roaster.name in relationships:
+                    score = relationships[roaster.name] + 2
+                    relationships[roaster.name] = 100 if score > 100 else score
         
         # Negative interactions or roasts decrease relationships slightly
         elif analysis.sentiment < -0.3:
             for roaster in roasters:
-                if roaster.name in primary.relationships:
-                    primary.relationships[roaster.name] = max(0, primary.relationships[roaster.name] - 1)
+                if roaster.name in relationships:
+                    score = relationships[roaster.name] - 1
+                    relationships[roaster.name] = 0 if score < 0 else score
     
-    def get_relationship_status(self) -> Dict[str, Dict[str, int]]:
-        """Get current relationship status between all roommates."""
-        relationships = {}
-        for roommate in self.roommates:
-            relationships[roommate.name] = roommate.relationships.copy()
-        return relationships
+    def get_relationship_status(self) -> Mapping[str, Mapping[str, int]]:
+        """Get a read-only, live view of relationship scores between all roommates.
+        
+        Callers that need a snapshot to mutate should copy with ``dict(...)``.
+        """
+        if self._rel_view is None:
+            self._rel_view = MappingProxyType({
+                roommate.name: MappingProxyType(roommate.relationships)
+                for roommate in self.roommates
+            })
+        return self._rel_view
     
     def personality_turn_stream(self, user_message: str) -> Iterator[str]:
         """Stream a personality-driven turn."""
         
         yield f"You: {user_message}\n"
+        turn_ts = datetime.now()
         
         # Analyze and choose responder
-        analysis = self.analyzer.analyze_message(user_message)
+        analysis = self._analyze(user_message)
         primary_responder = self._choose_primary_responder(analysis)
         
         # Stream primary response
@@ -466,7 +593,7 @@ Generate a witty, personality-appropriate roast. Keep it clever, not mean. One s
         
         # Add conversation entry to history
         self.interaction_history.append(ConversationEntry(
-            timestamp=datetime.now(),
+            timestamp=turn_ts,
             speaker="user",
             message=user_message,
             context_tags=analysis.topics,
@@ -474,12 +601,9 @@ Generate a witty, personality-appropriate roast. Keep it clever, not mean. One s
         ))
         
         # Stream roasts
-        potential_roasters = [r for r in self.roommates if r.name != primary_responder.name]
-        num_roasters = min(random.randint(2, 4), len(potential_roasters))
-        roasters = random.sample(potential_roasters, num_roasters)
+        roasters, targets = self._pick_roasters(primary_responder)
         
-        for roaster in roasters:
-            target = random.choice(["you", primary_responder.name])
+        for roaster, target in zip(roasters, targets):
             target_roommate = primary_responder if target == primary_responder.name else None
             
             yield f"{roaster.name}: "
@@ -506,7 +630,7 @@ Generate a witty, personality-appropriate roast. Keep it clever, not mean. One s
             
             # Add to history
             self.interaction_history.append(ConversationEntry(
-                timestamp=datetime.now(),
+                timestamp=turn_ts,
                 speaker=roaster.name,
                 message="[roast]",  # Placeholder since we're streaming
                 context_tags=analysis.topics,
@@ -532,45 +656,27 @@ Generate a witty, personality-appropriate roast. Keep it clever, not mean. One s
         user_message: str,
         target_roommate: Optional[EnhancedRoommate] = None
     ) -> str:
-        """Build roast prompt for streaming."""
-        roast_prompt = f"""You are {roaster.name}. Generate a single-line roast targeting {target}.
+        """Build the roast prompt shared by the blocking and streaming paths."""
+        roaster_block = self._roaster_cache.get(id(roaster)) or self._roaster_prelude(roaster)
+        lines = [f"""You are {roaster.name}. Generate a single-line roast targeting {target}.
 
-ROASTER PERSONALITY:
-- Style: {roaster.roast_signature}
-- Speech: {', '.join(roaster.cultural_context.get('speech_patterns', []))}
-- Roast Style: {roaster.cultural_context.get('roast_style', 'general')}
+{roaster_block}
 
-TARGET: {target}"""
+TARGET: {target}"""]
 
         if target_roommate:
-            roast_prompt += f"""
-TARGET PERSONALITY: {target_roommate.style}
-TARGET QUIRKS: {', '.join(target_roommate.quirks[:2])}"""
+            target_joined = self._joined.get(id(target_roommate)) or self._joined_fields(target_roommate)
+            lines.append(f"TARGET PERSONALITY: {target_roommate.style}")
+            lines.append(f"TARGET QUIRKS: {target_joined['top_quirks']}")
             
             # Add interaction dynamic if exists
-            interaction_key = (roaster.name, target_roommate.name)
-            reverse_key = (target_roommate.name, roaster.name)
-            
-            if interaction_key in self.interaction_dynamics:
-                roast_prompt += f"\nINTERACTION DYNAMIC: {self.interaction_dynamics[interaction_key]}"
-            elif reverse_key in self.interaction_dynamics:
-                roast_prompt += f"\nINTERACTION DYNAMIC: {self.interaction_dynamics[reverse_key]}"
-
-        roast_prompt += f"""
+            dynamic = self._dyn.get(roaster.name, {}).get(target_roommate.name)
+            if dynamic:
+                lines.append(f"INTERACTION DYNAMIC: {dynamic}")
 
+        lines.append(f"""
 USER MESSAGE CONTEXT: {user_message}
 
-Generate a witty, personality-appropriate roast. Keep it clever, not mean. One sentence only."""
+Generate a witty, personality-appropriate roast. Keep it clever, not mean. One sentence only.""")
 
-        return roast_prompt
-        num_roasters = min(random.randint(2, 4), len(potential_roasters))
-        roasters = random.sample(potential_roasters, num_roasters)
-        
-        for roaster in roasters:
-            target = random.choice(["you", primary_responder.name])
-            target_roommate = primary_responder if target == primary_responder.name else None
-            
-            yield f"{roaster.name}: "
-            roast = self.generate_roast(roaster, target, user_message, target_roommate)
-            yield roast
-            yield "\n"
\ No newline at end of file
+        return "\n".join(lines)
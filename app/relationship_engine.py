@@ -1,21 +1,126 @@
-from typing import Dict, Tuple, List
+import sys
+from bisect import bisect_left, insort
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, List
 from app.roommates import EnhancedRoommate
 
 
+def _intensity_for_score(score: float) -> float:
+    """Map a relationship score to a roast intensity modifier (0.5-1.5)."""
+    # High relationship (80-100) -> Low intensity (0.5-0.7)
+    # Medium relationship (40-60) -> Normal intensity (0.9-1.1)
+    # Low relationship (0-20) -> High intensity (1.3-1.5)
+    if score >= 80:
+        # Very good relationship - gentle roasts
+        return 0.5 + (score - 80) * 0.01  # 0.5 to 0.7
+    elif score >= 60:
+        # Good relationship - slightly gentle roasts
+        return 0.7 + (score - 60) * 0.01  # 0.7 to 0.9
+    elif score >= 40:
+        # Neutral relationship - normal intensity
+        return 0.9 + (score - 40) * 0.01  # 0.9 to 1.1
+    elif score >= 20:
+        # Poor relationship - harsher roasts
+        return 1.1 + (40 - score) * 0.01  # 1.1 to 1.3
+    else:
+        # Very poor relationship - very harsh roasts
+        return 1.3 + (20 - score) * 0.01  # 1.3 to 1.5
+
+
+# Shared stand-in for a roommate with no relationships yet; never mutated
+_NO_SCORES: Mapping[str, int] = MappingProxyType({})
+
+# Relationship change per (interaction type, success)
+_INTERACTION_DELTAS: Dict[Tuple[str, bool], int] = {
+    ('roast', True): -3, ('roast', False): -1,  # Successful roasts hurt more
+    ('defend', True): 5, ('defend', False): 2,  # Successful defenses help more
+    ('compliment', True): 4, ('compliment', False): 1,  # Successful compliments help
+    ('joke', True): 2, ('joke', False): -1,  # Good jokes help, bad jokes hurt
+    ('support', True): 3, ('support', False): 1,  # Support always helps
+    ('conflict', True): -5, ('conflict', False): -2,  # Conflicts always hurt
+}
+
+# The ladder is not a single affine map (each band restarts its slope), so
+# integer scores are looked up from a table built with it
+_INTENSITY_BY_SCORE: Tuple[float, ...] = tuple(_intensity_for_score(score) for score in range(101))
+
+
+def _status_for_score(score: float) -> str:
+    """Describe a relationship score in words."""
+    if score >= 90:
+        return "best friends"
+    elif score >= 80:
+        return "close friends"
+    elif score >= 70:
+        return "good friends"
+    elif score >= 60:
+        return "friendly"
+    elif score >= 40:
+        return "neutral"
+    elif score >= 30:
+        return "tense"
+    elif score >= 20:
+        return "hostile"
+    elif score >= 10:
+        return "enemies"
+    else:
+        return "bitter enemies"
+
+
+_STATUS_BY_SCORE: Tuple[str, ...] = tuple(_status_for_score(score) for score in range(101))
+
+
 class RelationshipEngine:
     """Manages relationships and interactions between roommates."""
     
     def __init__(self):
-        # Store relationships as (roommate1, roommate2) -> score
-        # We use a consistent ordering to avoid duplicate entries
-        self.relationship_matrix: Dict[Tuple[str, str], int] = {}
+        # Store relationships as roommate -> other roommate -> score, with
+        # every write mirrored so either name reads the pair without sorting
+        self.relationships: Dict[str, Dict[str, int]] = {}
+        
+        # Each roommate's neighbours kept sorted by score, so strongest and
+        # weakest queries are slices. Entries are (score, seq, name) and
+        # (-score, seq, name); seq is the order the neighbour was first
+        # written, which keeps ties in the same order a stable sort gives.
+        self._neighbor_seq: Dict[str, Dict[str, int]] = {}
+        self._ascending: Dict[str, List[Tuple[int, int, str]]] = {}
+        self._descending: Dict[str, List[Tuple[int, int, str]]] = {}
     
-    def _get_relationship_key(self, roommate1: str, roommate2: str) -> Tuple[str, str]:
-        """
-        Get a consistent key for the relationship matrix.
-        Always orders names alphabetically to avoid duplicate entries.
-        """
-        return tuple(sorted([roommate1, roommate2]))
+    def _set_score(self, roommate1: str, roommate2: str, score: int) -> None:
+        """Store a score under both names, alphabetically first name first."""
+        if roommate2 < roommate1:
+            roommate1, roommate2 = roommate2, roommate1
+        set_neighbor = self._set_neighbor
+        set_neighbor(roommate1, roommate2, score)
+        set_neighbor(roommate2, roommate1, score)
+    
+    def _set_neighbor(self, roommate: str, other: str, score: int) -> None:
+        """Write one direction of a score and move it within the sorted neighbour lists."""
+        row = self.relationships.get(roommate)
+        if row is None:
+            # Names are stored interned, so lookups with the same interned
+            # names (as the engines and profiles use) compare by identity
+            roommate = sys.intern(roommate)
+            row = self.relationships[roommate] = {}
+            self._neighbor_seq[roommate] = {}
+            self._ascending[roommate] = []
+            self._descending[roommate] = []
+        ascending = self._ascending[roommate]
+        descending = self._descending[roommate]
+        seqs = self._neighbor_seq[roommate]
+        
+        old_score = row.get(other)
+        if old_score is None:
+            other = sys.intern(other)
+            seq = seqs[other] = len(seqs)
+        else:
+            seq = seqs[other]
+            del ascending[bisect_left(ascending, (old_score, seq, other))]
+            del descending[bisect_left(descending, (-old_score, seq, other))]
+        
+        row[other] = score
+        insort(ascending, (score, seq, other))
+        insort(descending, (-score, seq, other))
     
     def update_relationship(self, roommate1: str, roommate2: str, delta: int) -> None:
         """
@@ -29,12 +134,13 @@ class RelationshipEngine:
         if roommate1 == roommate2:
             return  # Can't have relationship with self
         
-        key = self._get_relationship_key(roommate1, roommate2)
-        current_score = self.relationship_matrix.get(key, 50)  # Default neutral score
+        current_score = self.relationships.get(roommate1, _NO_SCORES).get(roommate2, 50)  # Default neutral score
         
-        # Update score and clamp to valid range (0-100)
-        new_score = max(0, min(100, current_score + delta))
-        self.relationship_matrix[key] = new_score
+        # Update score and clamp to valid range (0-100); comparisons rather
+        # than min()/max() keep the clamp free of builtin calls
+        new_score = current_score + delta
+        new_score = 0 if new_score < 0 else 100 if new_score > 100 else new_score
+        self._set_score(roommate1, roommate2, new_score)
     
     def get_relationship_score(self, roommate1: str, roommate2: str) -> int:
         """
@@ -50,8 +156,7 @@ class RelationshipEngine:
         if roommate1 == roommate2:
             return 100  # Perfect relationship with self
         
-        key = self._get_relationship_key(roommate1, roommate2)
-        return self.relationship_matrix.get(key, 50)  # Default neutral score
+        return self.relationships.get(roommate1, _NO_SCORES).get(roommate2, 50)  # Default neutral score
     
     def should_defend(self, defender: str, target: str) -> bool:
         """
@@ -67,7 +172,7 @@ class RelationshipEngine:
         if defender == target:
             return False  # Can't defend yourself
         
-        relationship_score = self.get_relationship_score(defender, target)
+        relationship_score = self.relationships.get(defender, _NO_SCORES).get(target, 50)
         
         # Defend if relationship score is above 70
         return relationship_score > 70
@@ -88,28 +193,11 @@ class RelationshipEngine:
         if roaster == target:
             return 1.0  # Normal intensity for self-roasts
         
-        relationship_score = self.get_relationship_score(roaster, target)
-        
-        # Convert relationship score (0-100) to intensity modifier (0.5-1.5)
-        # High relationship (80-100) -> Low intensity (0.5-0.7)
-        # Medium relationship (40-60) -> Normal intensity (0.9-1.1)
-        # Low relationship (0-20) -> High intensity (1.3-1.5)
+        relationship_score = self.relationships.get(roaster, _NO_SCORES).get(target, 50)
         
-        if relationship_score >= 80:
-            # Very good relationship - gentle roasts
-            return 0.5 + (relationship_score - 80) * 0.01  # 0.5 to 0.7
-        elif relationship_score >= 60:
-            # Good relationship - slightly gentle roasts
-            return 0.7 + (relationship_score - 60) * 0.01  # 0.7 to 0.9
-        elif relationship_score >= 40:
-            # Neutral relationship - normal intensity
-            return 0.9 + (relationship_score - 40) * 0.01  # 0.9 to 1.1
-        elif relationship_score >= 20:
-            # Poor relationship - harsher roasts
-            return 1.1 + (40 - relationship_score) * 0.01  # 1.1 to 1.3
-        else:
-            # Very poor relationship - very harsh roasts
-            return 1.3 + (20 - relationship_score) * 0.01  # 1.3 to 1.5
+        if type(relationship_score) is int and 0 <= relationship_score <= 100:
+            return _INTENSITY_BY_SCORE[relationship_score]
+        return _intensity_for_score(relationship_score)
     
     def get_all_relationships(self, roommate_name: str) -> Dict[str, int]:
         """
@@ -121,15 +209,7 @@ class RelationshipEngine:
         Returns:
             Dictionary mapping other roommate names to relationship scores
         """
-        relationships = {}
-        
-        for (name1, name2), score in self.relationship_matrix.items():
-            if name1 == roommate_name:
-                relationships[name2] = score
-            elif name2 == roommate_name:
-                relationships[name1] = score
-        
-        return relationships
+        return dict(self.relationships.get(roommate_name, _NO_SCORES))
     
     def get_strongest_relationships(self, roommate_name: str, limit: int = 3) -> List[Tuple[str, int]]:
         """
@@ -142,12 +222,8 @@ class RelationshipEngine:
         Returns:
             List of tuples (other_roommate_name, relationship_score) sorted by score descending
         """
-        relationships = self.get_all_relationships(roommate_name)
-        
-        # Sort by relationship score (descending)
-        sorted_relationships = sorted(relationships.items(), key=lambda x: x[1], reverse=True)
-        
-        return sorted_relationships[:limit]
+        ranked = self._descending.get(roommate_name, [])
+        return [(other, -score) for score, _, other in ranked[:limit]]
     
     def get_weakest_relationships(self, roommate_name: str, limit: int = 3) -> List[Tuple[str, int]]:
         """
@@ -160,12 +236,8 @@ class RelationshipEngine:
         Returns:
             List of tuples (other_roommate_name, relationship_score) sorted by score ascending
         """
-        relationships = self.get_all_relationships(roommate_name)
-        
-        # Sort by relationship score (ascending)
-        sorted_relationships = sorted(relationships.items(), key=lambda x: x[1])
-        
-        return sorted_relationships[:limit]
+        ranked = self._ascending.get(roommate_name, [])
+        return [(other, score) for score, _, other in ranked[:limit]]
     
     def simulate_interaction_outcome(
         self, 
@@ -189,16 +261,7 @@ class RelationshipEngine:
         if roommate1 == roommate2:
             return 0
         
-        base_changes = {
-            'roast': -3 if success else -1,  # Successful roasts hurt more
-            'defend': 5 if success else 2,   # Successful defenses help more
-            'compliment': 4 if success else 1,  # Successful compliments help
-            'joke': 2 if success else -1,    # Good jokes help, bad jokes hurt
-            'support': 3 if success else 1,  # Support always helps
-            'conflict': -5 if success else -2  # Conflicts always hurt
-        }
-        
-        delta = base_changes.get(interaction_type, 0)
+        delta = _INTERACTION_DELTAS.get((interaction_type, bool(success)), 0)
         
         # Apply the change
         if delta != 0:
@@ -219,24 +282,9 @@ class RelationshipEngine:
         """
         score = self.get_relationship_score(roommate1, roommate2)
         
-        if score >= 90:
-            return "best friends"
-        elif score >= 80:
-            return "close friends"
-        elif score >= 70:
-            return "good friends"
-        elif score >= 60:
-            return "friendly"
-        elif score >= 40:
-            return "neutral"
-        elif score >= 30:
-            return "tense"
-        elif score >= 20:
-            return "hostile"
-        elif score >= 10:
-            return "enemies"
-        else:
-            return "bitter enemies"
+        if type(score) is int and 0 <= score <= 100:
+            return _STATUS_BY_SCORE[score]
+        return _status_for_score(score)
     
     def reset_relationship(self, roommate1: str, roommate2: str) -> None:
         """
@@ -247,8 +295,7 @@ class RelationshipEngine:
             roommate2: Name of the second roommate
         """
         if roommate1 != roommate2:
-            key = self._get_relationship_key(roommate1, roommate2)
-            self.relationship_matrix[key] = 50
+            self._set_score(roommate1, roommate2, 50)
     
     def get_relationship_matrix_summary(self) -> Dict[str, Dict[str, int]]:
         """
@@ -257,15 +304,4 @@ class RelationshipEngine:
         Returns:
             Nested dictionary where result[roommate1][roommate2] = relationship_score
         """
-        summary = {}
-        
-        for (name1, name2), score in self.relationship_matrix.items():
-            if name1 not in summary:
-                summary[name1] = {}
-            if name2 not in summary:
-                summary[name2] = {}
-            
-            summary[name1][name2] = score
-            summary[name2][name1] = score
-        
-        return summary
\ No newline at end of file
+        return {name: dict(scores) for name, scores in self.relationships.items()}
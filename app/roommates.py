@@ -1,8 +1,14 @@
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+import copy
+import sys
+from array import array
+from collections import deque
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field, replace
+from itertools import islice
+from typing import List, Dict, Any, ClassVar, Deque, Iterator, Mapping, Optional, Sequence, Tuple
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConversationEntry:
     timestamp: datetime
     speaker: str
@@ -11,7 +17,7 @@ class ConversationEntry:
     sentiment: float
     effectiveness_score: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnalysisResult:
     topics: List[str]
     sentiment: float
@@ -20,7 +26,7 @@ class AnalysisResult:
     repeated_phrases: List[str]
     behavioral_flags: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class ConversationContext:
     current_topic: str
     participants: List[str]
@@ -28,18 +34,152 @@ class ConversationContext:
     emotional_tone: str
     thread_length: int
 
-@dataclass
+class RelationshipScores(MutableMapping):
+    """Relationship scores (0-100) stored as one byte per roommate in a cast.
+    
+    Every roommate of a cast shares the same ``names`` tuple and name->slot
+    index; only the score array is per instance. Names outside the cast are
+    kept in a small overflow dict so the mapping still accepts any key.
+    
+    Scores must be whole numbers from 0 to 100: others raise ValueError (or
+    TypeError for non-integers) instead of being stored.
+    """
+    
+    __slots__ = ("_names", "_index", "_scores", "_extra")
+    
+    _ABSENT = -1
+    
+    def __init__(
+        self,
+        names: Sequence[str],
+        index: Optional[Mapping[str, int]] = None,
+        fill: Optional[int] = None
+    ):
+        self._names = tuple(names)
+        self._index = index if index is not None else {n: i for i, n in enumerate(self._names)}
+        # ``fill`` gives every cast member that score up front
+        if fill is not None:
+            fill = self._check_score(fill)
+        self._scores = array('b', [self._ABSENT if fill is None else fill]) * len(self._names)
+        self._extra: Optional[Dict[str, int]] = None
+    
+    def __getitem__(self, name: str) -> int:
+        slot = self._index.get(name)
+        if slot is not None:
+            score = self._scores[slot]
+            if score != self._ABSENT:
+                return score
+        elif self._extra is not None and name in self._extra:
+            return self._extra[name]
+        raise KeyError(name)
+    
+    @staticmethod
+    def _check_score(score: int) -> int:
+        # The array holds signed bytes and uses -1 for "absent", so only
+        # 0-100 may be stored
+        if isinstance(score, bool) or not isinstance(score, int):
+            raise TypeError(f"relationship score must be an int, not {type(score).__name__}")
+        if not 0 <= score <= 100:
+            raise ValueError(f"relationship score must be between 0 and 100, got {score}")
+        return score
+    
+    def __setitem__(self, name: str, score: int) -> None:
+        score = self._check_score(score)
+        slot = self._index.get(name)
+        if slot is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[name] = score
+        else:
+            self._scores[slot] = score
+    
+    def __delitem__(self, name: str) -> None:
+        slot = self._index.get(name)
+        if slot is not None and self._scores[slot] != self._ABSENT:
+            self._scores[slot] = self._ABSENT
+        elif slot is None and self._extra is not None and name in self._extra:
+            del self._extra[name]
+        else:
+            raise KeyError(name)
+    
+    def __contains__(self, name: object) -> bool:
+        slot = self._index.get(name)
+        if slot is not None:
+            return self._scores[slot] != self._ABSENT
+        return self._extra is not None and name in self._extra
+    
+    def __iter__(self) -> Iterator[str]:
+        names = self._names
+        for slot, score in enumerate(self._scores):
+            if score != self._ABSENT:
+                yield names[slot]
+        if self._extra is not None:
+            yield from self._extra
+    
+    def __len__(self) -> int:
+        count = len(self._scores) - self._scores.count(self._ABSENT)
+        return count + (len(self._extra) if self._extra is not None else 0)
+    
+    def __copy__(self) -> "RelationshipScores":
+        # The names and index are shared by the whole cast; only scores copy
+        clone = RelationshipScores.__new__(RelationshipScores)
+        clone._names = self._names
+        clone._index = self._index
+        clone._scores = array('b', self._scores)
+        clone._extra = dict(self._extra) if self._extra is not None else None
+        return clone
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "RelationshipScores":
+        # Scores are plain ints, so a copy of the array is already deep
+        return self.__copy__()
+    
+    def copy(self) -> Dict[str, int]:
+        return dict(self.items())
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+@dataclass(slots=True, frozen=True)
+class PersonaSpec:
+    """The fixed part of a personality, shared by every roommate built from it."""
+    name: str
+    style: str
+    roast_signature: str
+    quirks: Tuple[str, ...]
+    triggers: Mapping[str, Sequence[str]]
+    spice: int = 2
+    baseline_mood: int = 50
+    roasting_strategy: str = "witty"
+    cultural_context: Mapping[str, Any] = field(default_factory=dict)
+    anti_triggers: Mapping[str, str] = field(default_factory=dict)
+    conversational_goals: Tuple[str, ...] = ()
+
+@dataclass(slots=True)
 class Roommate:
+    # Oldest memories drop off once this many are held
+    MEMORY_LIMIT: ClassVar[int] = 50
+    
     name: str
     style: str
     roast_signature: str
-    quirks: List[str]
-    triggers: Dict[str, List[str]]
+    quirks: Sequence[str]
+    triggers: Mapping[str, Sequence[str]]
     spice: int = 2
     roast_count: int = 0
-    memory: List[str] = field(default_factory=list)
+    memory: Deque[str] = field(default_factory=lambda: deque(maxlen=Roommate.MEMORY_LIMIT))
+    
+    def __post_init__(self) -> None:
+        # Names key relationship and history dicts everywhere; interned keys
+        # let those lookups match by identity
+        self.name = sys.intern(self.name)
+    
+    def recent_memory(self, k: int) -> List[str]:
+        """The ``k`` most recent memories, oldest first."""
+        if k <= 0:
+            return []
+        return list(islice(self.memory, max(0, len(self.memory) - k), None))
 
-@dataclass
+@dataclass(slots=True)
 class EnhancedRoommate(Roommate):
     # New personality fields
     mood: int = 50  # 1-100 scale
@@ -48,17 +188,64 @@ class EnhancedRoommate(Roommate):
     effectiveness_score: float = 50.0  # percentage of successful roasts
     
     # Relationship tracking
-    relationships: Dict[str, int] = field(default_factory=dict)  # roommate_name -> score (0-100)
+    relationships: MutableMapping[str, int] = field(default_factory=dict)  # roommate_name -> score (0-100)
     
-    # Enhanced memory system
-    conversation_memory: List[ConversationEntry] = field(default_factory=list)
+    # Enhanced memory system; unbounded here because MemoryManager enforces
+    # its own max_memory_size and prunes by effectiveness
+    conversation_memory: Deque[ConversationEntry] = field(default_factory=deque)
     user_patterns: Dict[str, Any] = field(default_factory=dict)
     
     # Cultural context for roasting
-    cultural_context: Dict[str, Any] = field(default_factory=dict)
+    cultural_context: Mapping[str, Any] = field(default_factory=dict)
 
     # Anti-triggers for out-of-character moments
-    anti_triggers: Dict[str, str] = field(default_factory=dict)
+    anti_triggers: Mapping[str, str] = field(default_factory=dict)
 
     # Conversational goals
-    conversational_goals: List[str] = field(default_factory=list)
+    conversational_goals: Sequence[str] = field(default_factory=list)
+    
+    # Persona this roommate was built from, if any
+    spec: Optional[PersonaSpec] = None
+    
+    @classmethod
+    def from_spec(cls, spec: PersonaSpec) -> "EnhancedRoommate":
+        """Build a roommate at its baseline mood with fresh session state.
+        
+        The persona's strings and mappings are shared by reference, so they
+        must be treated as read-only.
+        """
+        return cls(
+            name=spec.name,
+            style=spec.style,
+            roast_signature=spec.roast_signature,
+            quirks=spec.quirks,
+            triggers=spec.triggers,
+            spice=spec.spice,
+            mood=spec.baseline_mood,
+            baseline_mood=spec.baseline_mood,
+            roasting_strategy=spec.roasting_strategy,
+            cultural_context=spec.cultural_context,
+            anti_triggers=spec.anti_triggers,
+            conversational_goals=spec.conversational_goals,
+            spec=spec
+        )
+    
+    def clone(self) -> "EnhancedRoommate":
+        """Copy this roommate with its own session state.
+        
+        Profile fields (style, quirks, triggers, cultural context, ...) are
+        shared with the original, so they must be treated as read-only;
+        memory, relationships, conversation memory and user patterns are
+        fresh copies.
+        """
+        return replace(
+            self,
+            memory=copy.copy(self.memory),
+            relationships=copy.copy(self.relationships),
+            conversation_memory=copy.copy(self.conversation_memory),
+            user_patterns=dict(self.user_patterns)
+        )
+    
+    def get_relationship(self, name: str, default: int = 50) -> int:
+        """Score towards another roommate, or ``default`` if there is none."""
+        return self.relationships.get(name, default)
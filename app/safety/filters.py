@@ -1,7 +1,12 @@
 import re
-PROTECTED = re.compile(r"\b(race|religion|gender|sexual|disab|ethnic|caste)\b", re.IGNORECASE)
-SLUR = re.compile(r"\b(\w*slur\w*)\b", re.IGNORECASE)
+# Protected topics and anything slur-like, checked in one pass
+BANNED = re.compile(r"\b(?:race|religion|gender|sexual|disab|ethnic|caste|\w*slur\w*)\b", re.IGNORECASE)
+# Literal cores of BANNED; a roast containing none of them can't match it.
+# casefold() covers the regex's case-insensitivity once the combining dot
+# it adds after "İ" is dropped and dotless "ı" is mapped to "i".
+BANNED_TERMS = ("race", "religion", "gender", "sexual", "disab", "ethnic", "caste", "slur")
 def sanitize_roast(text: str) -> str:
-    if PROTECTED.search(text) or SLUR.search(text):
+    folded = text.casefold().replace("\u0307", "").replace("ı", "i")
+    if any(term in folded for term in BANNED_TERMS) and BANNED.search(text):
         return "Let's keep it classy—PG-13 roast only."
     return text.strip()[:200]
@@ -0,0 +1,193 @@
+# app/ui/_common.py
+"""
+Pieces shared by the CLI front ends (app.ui.cli and app.ui.personality_cli).
+"""
+from __future__ import annotations
+
+import sys
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping, Tuple
+from rich.console import Console, COLOR_SYSTEMS
+from rich.style import Style
+from rich.text import Text
+
+# Adapters
+try:
+    from app.adapters.ollama_streaming import OllamaStreamingAdapter  # streaming provider
+except Exception:
+    OllamaStreamingAdapter = None  # type: ignore
+
+try:
+    from app.adapters.lmstudio import LMStudioAdapter  # non-stream (OpenAI-compat)
+except Exception:
+    LMStudioAdapter = None  # type: ignore
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Config: colors & descriptions
+# ──────────────────────────────────────────────────────────────────────────────
+
+# Rich styles per roommate (tweak as you like)
+CHARACTER_COLORS = {
+    "CodeMaster": "bright_blue",
+    "SavageBurn": "bright_red",
+    "UncleJi": "yellow",
+    "ChefCritic": "green",
+    "BeatDrop": "magenta",
+    "ChaosKing": "bright_black",
+    "QuietStorm": "cyan",
+    "PennyPincher": "bright_yellow",
+    "DeepThought": "bright_magenta",
+    # fallback color used if roommate not in this map
+    "_default": "white",
+    # color for the "You: ..." prefix
+    "_you": "bold white",
+}
+
+# The same styles parsed once, so printing a chunk doesn't re-parse its style
+CHARACTER_STYLES = {name: Style.parse(color) for name, color in CHARACTER_COLORS.items()}
+
+# Intro table rows: (personality, signature style, key quirk) per roommate
+PERSONALITY_DESCRIPTIONS: Mapping[str, Tuple[str, str, str]] = MappingProxyType({
+    "CodeMaster": ("Tech Nerd", "Technical superiority burns", "Uses programming terms daily"),
+    "SavageBurn": ("Professional Roaster", "Devastating one-liners", "Never misses a roast opportunity"),
+    "UncleJi": ("Indian Uncle", "Disappointed uncle energy", "Compares everything to India"),
+    "ChefCritic": ("Food Snob", "Culinary superiority complex", "Judges everyone's cooking"),
+    "BeatDrop": ("DJ Party Guy", "Music-based burns", "Life revolves around beats"),
+    "ChaosKing": ("Messy Rebel", "Chaotic deflection", "Organized chaos is still organized"),
+    "QuietStorm": ("Shy Observer", "Innocent savage burns", "Soft-spoken but deadly"),
+    "PennyPincher": ("Extreme Cheapskate", "Money-shaming guilt trips", "Calculates cost of everything"),
+    "DeepThought": ("Overthinking Philosopher", "Existential confusion", "Turns everything into philosophy")
+})
+
+# Intro table columns: (header, add_column options)
+_INTRO_COLUMNS: Tuple[Tuple[str, Mapping[str, Any]], ...] = (
+    ("Roommate", {"style": "bold", "width": 12}),
+    ("Personality", {"width": 20}),
+    ("Signature Style", {"width": 30}),
+    ("Key Quirk", {"width": 25}),
+)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ──────────────────────────────────────────────────────────────────────────────
+
+def parse_spoken_line(line: str) -> Tuple[str | None, str | None]:
+    """Split 'Name: text' → (Name, text). Returns (None, None) if not matched."""
+    if not isinstance(line, str):
+        return None, None
+    # One partition finds the colon and splits on it without building a list
+    who, sep, text = line.partition(":")
+    if sep:
+        who, text = who.strip(), text.strip()
+        if who and text:
+            return who, text
+    return None, None
+
+
+def paced(chunks: Iterable[str], pause: float) -> Iterator[str]:
+    """Yield chunks at most one per ``pause`` seconds, for a typewriter effect.
+    
+    Only sleeps for whatever is left of the interval, so a stream that is
+    already slower than ``pause`` (or time spent printing and speaking) isn't
+    slowed down further.
+    """
+    if pause <= 0:
+        yield from chunks
+        return
+    next_deadline = time.monotonic()
+    for chunk in chunks:
+        delay = next_deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        next_deadline = max(time.monotonic(), next_deadline) + pause
+        yield chunk
+
+
+@lru_cache(maxsize=None)
+def ansi_codes(console: Console, style: Style) -> Tuple[str, str]:
+    """ANSI codes that turn ``style`` on and off on the console's terminal.
+    
+    Both are empty when the console has no colour (e.g. output is piped) or
+    needs the legacy Windows API, so raw writes match what Rich would print.
+    """
+    color_system = console.color_system
+    if color_system is None or console.legacy_windows:
+        return "", ""
+    if console.no_color:
+        style = style.without_color
+    pre, _, post = style.render("\0", color_system=COLOR_SYSTEMS[color_system]).partition("\0")
+    return pre, post
+
+
+def roommate_table(roommates: Iterable[Any]):
+    """Build the intro table of roommates and their personalities.
+    
+    The table only depends on the roommates' names, so it is built once per
+    cast and reused every time the intro is shown.
+    """
+    return _roommate_table(tuple(roommate.name for roommate in roommates))
+
+
+@lru_cache(maxsize=8)
+def _roommate_table(names: Tuple[str, ...]):
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold magenta")
+    for header, options in _INTRO_COLUMNS:
+        table.add_column(header, **options)
+
+    for name in names:
+        desc, style, quirk = PERSONALITY_DESCRIPTIONS.get(name, ("Unknown", "Generic", "Mysterious"))
+        table.add_row(
+            Text(name, style=CHARACTER_STYLES.get(name, CHARACTER_STYLES["_default"])),
+            desc,
+            style,
+            quirk
+        )
+    return table
+
+
+def enable_line_editing(commands: Iterable[str]) -> None:
+    """Give input() readline history and tab completion of ``commands``.
+    
+    Does nothing when stdin isn't a terminal or the readline module is
+    missing (e.g. on Windows).
+    """
+    if not sys.stdin.isatty():
+        return
+    try:
+        import readline
+    except ImportError:
+        return
+
+    words = tuple(sorted(commands))
+
+    def complete(text: str, state: int) -> str | None:
+        matches = [word for word in words if word.startswith(text.lower())]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(complete)
+    if "libedit" in (readline.__doc__ or ""):
+        # macOS ships libedit, which has its own binding syntax
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+
+
+def build_adapter(stream: bool):
+    """Select provider by streaming flag."""
+    if stream:
+        if OllamaStreamingAdapter is not None:
+            return OllamaStreamingAdapter()
+        # The OpenAI-compatible adapter can stream too
+        if LMStudioAdapter is None:
+            raise RuntimeError(
+                "OllamaStreamingAdapter not available. Ensure app/adapters/ollama_streaming.py exists."
+            )
+        return LMStudioAdapter()
+    if LMStudioAdapter is None:
+        raise RuntimeError("LMStudioAdapter not available. Ensure app/adapters/lmstudio.py exists.")
+    return LMStudioAdapter()
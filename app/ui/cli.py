@@ -1,98 +1,57 @@
 # app/ui/cli.py
 from __future__ import annotations
 
-import argparse
+import importlib
+import importlib.util
+import queue
 import sys
-import time
-from typing import Tuple, List, Any
+import threading
+from functools import lru_cache
+from typing import Callable, Tuple, List, Any
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+from rich.style import Style
+from rich.text import Text
 
 # Engine
 from app.engine import Engine
 from app.audio_manager import AudioManager
 
-# Adapters
-try:
-    from app.adapters.ollama_streaming import OllamaStreamingAdapter  # streaming provider
-except Exception:
-    OllamaStreamingAdapter = None  # type: ignore
-
-try:
-    from app.adapters.lmstudio import LMStudioAdapter  # non-stream (OpenAI-compat)
-except Exception:
-    LMStudioAdapter = None  # type: ignore
+# Shared colors and helpers (CHARACTER_COLORS is re-exported for callers of this module)
+from app.ui._common import (
+    CHARACTER_COLORS,
+    CHARACTER_STYLES,
+    ansi_codes,
+    build_adapter,
+    enable_line_editing,
+    paced,
+    parse_spoken_line,
+    roommate_table,
+)
 
 console = Console()
 
 # ──────────────────────────────────────────────────────────────────────────────
-# Config: colors & timing
+# Config: timing
 # ──────────────────────────────────────────────────────────────────────────────
 
-# Rich styles per roommate (tweak as you like)
-CHARACTER_COLORS = {
-    # Original roommates
-    
-    # New personality roommates
-    "CodeMaster": "bright_blue",
-    "SavageBurn": "bright_red", 
-    "UncleJi": "yellow",
-    "ChefCritic": "green",
-    "BeatDrop": "magenta",
-    "ChaosKing": "bright_black",
-    "QuietStorm": "cyan",
-    "PennyPincher": "bright_yellow",
-    "DeepThought": "bright_magenta",
-    # fallback color used if roommate not in this map
-    "_default": "white",
-    # color for the "You: ..." prefix
-    "_you": "bold white",
-}
-
-# Pause per streamed chunk (seconds). Increase to slow down typing effect.
+# Minimum gap between streamed chunks for a bare --typewriter (seconds). Increase to slow down typing effect.
 PAUSE_S = 0.03
 
 
-def display_roommate_intro():
-    """Display an introduction to all the unique roommates."""
+def display_roommate_intro(roommates: List[Any] | None = None):
+    """Display an introduction to all the unique roommates.
+    
+    Pass the engine's roommates to show them; otherwise a fresh cast is built.
+    """
     console.print("\n[bold bright_cyan]🏠 Welcome to the Flatshare Chaos! 🏠[/bold bright_cyan]")
     console.print("[dim]Meet your chaotic roommates...[/dim]\n")
     
     try:
-        from app.personality_profiles import create_flatshare_chaos_roommates
-        roommates = create_flatshare_chaos_roommates()
+        if roommates is None:
+            from app.personality_profiles import create_flatshare_chaos_roommates
+            roommates = create_flatshare_chaos_roommates()
         
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Roommate", style="bold", width=12)
-        table.add_column("Personality", width=20)
-        table.add_column("Signature Style", width=30)
-        table.add_column("Key Quirk", width=25)
-        
-        personality_descriptions = {
-            "CodeMaster": ("Tech Nerd", "Technical superiority burns", "Uses programming terms daily"),
-            "SavageBurn": ("Professional Roaster", "Devastating one-liners", "Never misses a roast opportunity"),
-            "UncleJi": ("Indian Uncle", "Disappointed uncle energy", "Compares everything to India"),
-            "ChefCritic": ("Food Snob", "Culinary superiority complex", "Judges everyone's cooking"),
-            "BeatDrop": ("DJ Party Guy", "Music-based burns", "Life revolves around beats"),
-            "ChaosKing": ("Messy Rebel", "Chaotic deflection", "Organized chaos is still organized"),
-            "QuietStorm": ("Shy Observer", "Innocent savage burns", "Soft-spoken but deadly"),
-            "PennyPincher": ("Extreme Cheapskate", "Money-shaming guilt trips", "Calculates cost of everything"),
-            "DeepThought": ("Overthinking Philosopher", "Existential confusion", "Turns everything into philosophy")
-        }
-        
-        for roommate in roommates:
-            name = roommate.name
-            desc, style, quirk = personality_descriptions.get(name, ("Unknown", "Generic", "Mysterious"))
-            color = CHARACTER_COLORS.get(name, "white")
-            table.add_row(
-                f"[{color}]{name}[/{color}]",
-                desc,
-                style,
-                quirk
-            )
-        
-        console.print(table)
+        console.print(roommate_table(roommates))
         console.print("\n[dim]Each roommate has unique triggers, speech patterns, and interaction dynamics![/dim]")
         console.print("[dim]Type 'help' for available commands.[/dim]\n")
         
@@ -101,9 +60,12 @@ def display_roommate_intro():
         console.print("[dim]Using original roommate personalities...[/dim]\n")
 
 
-def display_help():
-    """Display available commands."""
-    help_panel = Panel(
+@lru_cache(maxsize=1)
+def _help_panel():
+    """The help panel, built on first use and reused."""
+    from rich.panel import Panel
+    
+    return Panel(
         """[bold]Available Commands:[/bold]
 
 • [cyan]help[/cyan] - Show this help message
@@ -117,41 +79,78 @@ Just chat naturally and watch the chaos unfold!""",
         title="[bold bright_cyan]Flatshare Chaos Help[/bold bright_cyan]",
         border_style="cyan"
     )
-    console.print(help_panel)
+
+
+def display_help():
+    """Display available commands."""
+    console.print(_help_panel())
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
-def parse_spoken_line(line: str) -> Tuple[str | None, str | None]:
-    """Split 'Name: text' → (Name, text). Returns (None, None) if not matched."""
-    if not isinstance(line, str) or ":" not in line:
-        return None, None
-    who, text = line.split(":", 1)
-    who, text = who.strip(), text.strip()
-    if not who or not text:
-        return None, None
-    return who, text
+def read_user_message(prompt: str) -> str:
+    """Read one line of user input, raising EOFError at end of input.
+    
+    Interactive terminals keep input() for line editing and history; piped
+    or scripted input is read straight from stdin without readline.
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    console.file.write(prompt)
+    console.file.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+def start_speech_worker(make_audio_manager: Callable[[], AudioManager] = AudioManager) -> Tuple[queue.Queue, threading.Thread]:
+    """Start a daemon thread that speaks queued (speaker, text) lines in order.
+    
+    The thread loads the voice models first, so the intro and prompt don't
+    wait for them; lines queued meanwhile are spoken once they are loaded.
+    Synthesis and playback block until a line has been spoken, so doing
+    them here also lets the chat keep printing. Speakers without a voice
+    are skipped. Put None on the queue and join the thread to let it finish
+    the lines already queued.
+    """
+    lines: queue.Queue = queue.Queue()
+
+    def speak() -> None:
+        audio_manager = make_audio_manager()
+        while True:
+            item = lines.get()
+            if item is None:
+                break
+            speaker, text = item
+            audio_manager.say(text, speaker)
 
+    worker = threading.Thread(target=speak, name="tts", daemon=True)
+    worker.start()
+    return lines, worker
 
+
+@lru_cache(maxsize=1)
 def _load_roommates_module() -> Any | None:
     """
     Try to import roommates module from multiple locations:
       1) app.roommates  (repo_root/app/roommates.py)
       2) roommates      (repo_root/roommates.py)
     Return the module or None.
+    
+    Locations are probed with find_spec, so a missing module is skipped
+    without raising and unwinding an ImportError.
     """
-    try:
-        from app import roommates as rm  # type: ignore
-        return rm
-    except Exception:
-        pass
-    try:
-        import roommates as rm  # type: ignore
-        return rm
-    except Exception:
-        return None
+    for name in ("app.roommates", "roommates"):
+        try:
+            if importlib.util.find_spec(name) is None:
+                continue
+            return importlib.import_module(name)
+        except Exception:
+            continue
+    return None
 
 
 def load_roommates() -> List[object]:
@@ -192,49 +191,7 @@ def load_roommates() -> List[object]:
                 except Exception:
                     pass
 
-    # 3) Inline defaults
-    if rm is not None and hasattr(rm, "Roommate"):
-        R = getattr(rm, "Roommate")
-    else:
-        # Minimal attribute-compatible fallback
-        class R:  # noqa: N801
-            def __init__(self, name, style, roast_signature, quirks=None, triggers=None, spice=2):
-                self.name = name
-                self.style = style
-                self.roast_signature = roast_signature
-                self.quirks = quirks or []
-                self.triggers = triggers or {}
-                self.spice = spice
-                self.roast_count = 0
-                self.memory = []
-
-    def mk(name: str, style: str, roast_signature: str, quirks=None, triggers=None, spice: int = 2):
-        return R(
-            name=name,
-            style=style,
-            roast_signature=roast_signature,
-            quirks=quirks or [],
-            triggers=triggers or {},
-            spice=spice,
-        )
-
-    defaults = [
-        
-    ]
-    return defaults
-
-
-def build_adapter(stream: bool):
-    """Select provider by streaming flag."""
-    if stream:
-        if OllamaStreamingAdapter is None:
-            raise RuntimeError(
-                "OllamaStreamingAdapter not available. Ensure app/adapters/ollama_streaming.py exists."
-            )
-        return OllamaStreamingAdapter()
-    if LMStudioAdapter is None:
-        raise RuntimeError("LMStudioAdapter not available. Ensure app/adapters/lmstudio.py exists.")
-    return LMStudioAdapter()
+    return []
 
 
 def build_engine(adapter, spice: int) -> Engine:
@@ -251,6 +208,9 @@ def build_engine(adapter, spice: int) -> Engine:
 # ──────────────────────────────────────────────────────────────────────────────
 
 def main():
+    # Only needed to run the CLI, not to import this module
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Flatshare Chaos: Roast Edition (CLI)")
     parser.add_argument(
         "--backend",
@@ -259,27 +219,49 @@ def main():
         help="Kept for compatibility; adapter is selected by --stream.",
     )
     parser.add_argument("--spice", type=int, default=2)
-    parser.add_argument("--stream", action="store_true", help="Stream tokens live")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream tokens live",
+    )
+    parser.add_argument(
+        "--coalesce",
+        action="store_true",
+        help="With --stream, show each speaker's line once it completes instead of token by token.",
+    )
     parser.add_argument("--voice", action="store_true", help="Enable text-to-speech voice output.")
+    parser.add_argument(
+        "--typewriter",
+        type=float,
+        nargs="?",
+        const=PAUSE_S,
+        default=0.0,
+        metavar="SECONDS",
+        help=f"With --stream, space chunks at least SECONDS apart for a typing effect (default {PAUSE_S}s).",
+    )
     # Optional: override pause/color via flags later if you want
     args = parser.parse_args()
 
     adapter = build_adapter(stream=args.stream)
     engine = build_engine(adapter=adapter, spice=args.spice)
     
-    audio_manager = None
+    speech_queue = speech_worker = None
     if args.voice:
-        audio_manager = AudioManager()
+        # Voices load on the worker thread while the intro is shown
+        speech_queue, speech_worker = start_speech_worker()
+
+    # History and tab completion for the prompt
+    enable_line_editing(("help", "personalities", "exit", "quit"))
 
     # Display intro
-    display_roommate_intro()
+    display_roommate_intro(engine.roommates)
 
     console.print(
         "───────────────────────────────────────────────────────── [bold bright_cyan]Flatshare Chaos: Roast Edition (CLI)[/bold bright_cyan] ──────────────────────────────────────────────────────────"
     )
     while True:
         try:
-            user_msg = input("> ").strip()
+            user_msg = read_user_message("> ").strip()
         except (EOFError, KeyboardInterrupt):
             console.print("\n[bright_cyan]Thanks for visiting the chaos! 👋[/bright_cyan]")
             break
@@ -287,81 +269,114 @@ def main():
         if not user_msg:
             continue
             
-        # Handle special commands
-        if user_msg.lower() in {"exit", "quit"}:
+        # Handle special commands, lowercasing the message once
+        command = user_msg.lower()
+        if command in {"exit", "quit"}:
             console.print("\n[bright_cyan]Thanks for visiting the chaos! 👋[/bright_cyan]")
             break
-        elif user_msg.lower() == "personalities":
-            display_roommate_intro()
+        elif command == "personalities":
+            display_roommate_intro(engine.roommates)
             continue
-        elif user_msg.lower() == "help":
+        elif command == "help":
             display_help()
             continue
 
         if args.stream:
-            # Streaming with per-roommate colors + pause per chunk
+            # Streaming with per-roommate colors. Each chunk is written as it
+            # arrives; --coalesce instead writes a speaker segment once it
+            # completes (--typewriter always writes per chunk). Output goes
+            # straight to the console's file wrapped in precomputed ANSI
+            # codes; model text needs no markup parsing or highlighting.
             current_speaker: str | None = None
-            current_style: str = CHARACTER_COLORS["_default"]
+            # Fixed styles held in locals for the loop
+            default_style = CHARACTER_STYLES["_default"]
+            you_style = CHARACTER_STYLES["_you"]
+            current_style: Style = default_style
             full_line_buffer = ""
-
-
-            for chunk in engine.turn_stream(user_msg):
+            pause = args.typewriter
+            live = pause > 0 or not args.coalesce
+            segment: List[str] = []
+            out = console.file
+
+            def flush_segment() -> None:
+                if segment:
+                    pre, post = ansi_codes(console, current_style)
+                    out.write(pre + "".join(segment) + post)
+                    segment.clear()
+
+            for chunk in paced(engine.turn_stream(user_msg), pause):
                 # Newline indicates speaker finished
                 if chunk == "\n":
-                    if audio_manager and current_speaker and full_line_buffer:
+                    flush_segment()
+                    if speech_queue is not None and current_speaker and full_line_buffer:
                         # Only use TTS for roommates (not "You"), and clean the text
-                        if current_speaker != "You" and current_speaker in audio_manager.voices:
+                        if current_speaker != "You":
                             # Remove any speaker prefix that might be in the buffer
                             clean_text = full_line_buffer.strip()
                             if clean_text:
-                                audio_manager.say(clean_text, current_speaker)
+                                speech_queue.put((current_speaker, clean_text))
 
-                    console.print()  # newline
+                    out.write("\n")
+                    out.flush()
                     current_speaker = None
-                    current_style = CHARACTER_COLORS["_default"]
+                    current_style = default_style
                     full_line_buffer = ""
-                    time.sleep(PAUSE_S)
                     continue
 
                 # Detect a speaker prefix (the engine yields "<Name>: " once before content)
-                if chunk.endswith(": ") and ":" in chunk:
-                    speaker = chunk.split(":", 1)[0].strip()
+                # endswith only compares the last two characters, so ordinary chunks
+                # are rejected without a scan; the name is the prefix chunk minus ": "
+                if chunk.endswith(": "):
+                    flush_segment()
+                    speaker = chunk[:-2].strip()
                     current_speaker = speaker
                     if speaker == "You":
-                        current_style = CHARACTER_COLORS.get("_you", "bold white")
+                        current_style = you_style
                     else:
-                        current_style = CHARACTER_COLORS.get(speaker, CHARACTER_COLORS["_default"])
-                    console.print(chunk, style=current_style, end="")
+                        current_style = CHARACTER_STYLES.get(speaker, default_style)
                 else:
                     # Regular content chunk; use the last known speaker style
                     full_line_buffer += chunk
-                    console.print(chunk, style=current_style, end="")
+                segment.append(chunk)
 
-                sys.stdout.flush()
-                time.sleep(PAUSE_S)
+                if live:
+                    flush_segment()
+                    out.flush()
 
             # Ensure final newline after turn
-            console.print()
+            flush_segment()
+            out.write("\n")
+            out.flush()
 
         else:
             # Legacy non-stream path (no typewriter, no per-chunk pause)
             lines = engine.turn(user_msg)
+            rendered: List[Text] = []
+            spoken: List[Tuple[str, str]] = []
             for line in lines:
                 who, text = parse_spoken_line(line)
-                style = CHARACTER_COLORS.get(who or "", CHARACTER_COLORS["_default"])
+                style = CHARACTER_STYLES.get(who or "", CHARACTER_STYLES["_default"])
                 if who == "You":
-                    style = CHARACTER_COLORS.get("_you", "bold white")
-                
-                console.print(line, style=style)
+                    style = CHARACTER_STYLES["_you"]
+                rendered.append(Text(line, style=style))
 
-                if audio_manager and who and text:
-                    # Only use TTS for roommates (not "You"), and ensure they have voices
-                    if who != "You" and who in audio_manager.voices:
-                        audio_manager.say(text, who)
+                if speech_queue is not None and who and text:
+                    # Only use TTS for roommates (not "You"); the worker skips those without voices
+                    if who != "You":
+                        spoken.append((who, text))
 
+            # The turn is joined into one Text, so it is rendered and written
+            # once; speech runs on the worker thread and may still be playing
+            # while the user types
+            console.print(Text("\n").join(rendered))
+            for item in spoken:
+                speech_queue.put(item)
+
+    if speech_worker is not None:
+        # Let the roommates finish what they were saying
+        speech_queue.put(None)
+        speech_worker.join()
 
 
-if __name__ == "__main__":
-    main()
 if __name__ == "__main__":
     main()
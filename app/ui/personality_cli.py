@@ -3,98 +3,52 @@ Enhanced CLI with unique personality-driven interactions.
 """
 
 import argparse
-import sys
-import time
-from typing import Tuple, List, Any
+from functools import lru_cache
+from typing import Tuple, List, Any, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.style import Style
+from rich.text import Text
 
 # Import our new personality system
 from app.personality_profiles import create_flatshare_chaos_roommates
 from app.personality_engine import PersonalityEngine
 
-# Adapters
-try:
-    from app.adapters.ollama_streaming import OllamaStreamingAdapter
-except Exception:
-    OllamaStreamingAdapter = None
-
-try:
-    from app.adapters.lmstudio import LMStudioAdapter
-except Exception:
-    LMStudioAdapter = None
+# Shared colors and helpers
+from app.ui._common import (
+    CHARACTER_COLORS,
+    CHARACTER_STYLES,
+    ansi_codes,
+    build_adapter,
+    enable_line_editing,
+    paced,
+    roommate_table,
+)
 
 console = Console()
 
-# Personality-specific colors for better visual distinction
-PERSONALITY_COLORS = {
-    "CodeMaster": "bright_blue",
-    "SavageBurn": "bright_red", 
-    "UncleJi": "yellow",
-    "ChefCritic": "green",
-    "BeatDrop": "magenta",
-    "ChaosKing": "bright_black",
-    "QuietStorm": "cyan",
-    "PennyPincher": "bright_yellow",
-    "DeepThought": "bright_magenta",
-    "_you": "bold white",
-    "_default": "white"
-}
-
 PAUSE_S = 0.03
 
-
-def build_adapter(stream: bool):
-    """Select provider by streaming flag."""
-    if stream:
-        if OllamaStreamingAdapter is None:
-            raise RuntimeError(
-                "OllamaStreamingAdapter not available. Ensure app/adapters/ollama_streaming.py exists."
-            )
-        return OllamaStreamingAdapter()
-    if LMStudioAdapter is None:
-        raise RuntimeError("LMStudioAdapter not available. Ensure app/adapters/lmstudio.py exists.")
-    return LMStudioAdapter()
+# Relationship table cell styles, parsed once
+_GOOD_SCORE = Style.parse("green")
+_NEUTRAL_SCORE = Style.parse("yellow")
+_TENSE_SCORE = Style.parse("red")
+_SELF_CELL = Text("--", style=Style.parse("dim"))
 
 
-def display_roommate_intro():
-    """Display an introduction to all the unique roommates."""
+def display_roommate_intro(roommates: Optional[List[Any]] = None):
+    """Display an introduction to all the unique roommates.
+    
+    Pass the engine's roommates to show them; otherwise a fresh cast is built.
+    """
     console.print("\n[bold bright_cyan]🏠 Welcome to the Flatshare Chaos! 🏠[/bold bright_cyan]")
     console.print("[dim]Meet your chaotic roommates...[/dim]\n")
     
-    roommates = create_flatshare_chaos_roommates()
-    
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Roommate", style="bold", width=12)
-    table.add_column("Personality", width=20)
-    table.add_column("Signature Style", width=30)
-    table.add_column("Key Quirk", width=25)
-    
-    personality_descriptions = {
-        "CodeMaster": ("Tech Nerd", "Technical superiority burns", "Uses programming terms daily"),
-        "SavageBurn": ("Professional Roaster", "Devastating one-liners", "Never misses a roast opportunity"),
-        "UncleJi": ("Indian Uncle", "Disappointed uncle energy", "Compares everything to India"),
-        "ChefCritic": ("Food Snob", "Culinary superiority complex", "Judges everyone's cooking"),
-        "BeatDrop": ("DJ Party Guy", "Music-based burns", "Life revolves around beats"),
-        "ChaosKing": ("Messy Rebel", "Chaotic deflection", "Organized chaos is still organized"),
-        "QuietStorm": ("Shy Observer", "Innocent savage burns", "Soft-spoken but deadly"),
-        "PennyPincher": ("Extreme Cheapskate", "Money-shaming guilt trips", "Calculates cost of everything"),
-        "DeepThought": ("Overthinking Philosopher", "Existential confusion", "Turns everything into philosophy")
-    }
+    if roommates is None:
+        roommates = create_flatshare_chaos_roommates()
     
-    for roommate in roommates:
-        name = roommate.name
-        desc, style, quirk = personality_descriptions.get(name, ("Unknown", "Generic", "Mysterious"))
-        color = PERSONALITY_COLORS.get(name, "white")
-        table.add_row(
-            f"[{color}]{name}[/{color}]",
-            desc,
-            style,
-            quirk
-        )
-    
-    console.print(table)
+    console.print(roommate_table(roommates))
     console.print("\n[dim]Each roommate has unique triggers, speech patterns, and interaction dynamics![/dim]")
     console.print("[dim]Type 'relationships' to see how they get along with each other.[/dim]")
     console.print("[dim]Type 'help' for more commands.[/dim]\n")
@@ -109,28 +63,31 @@ def display_relationships(engine: PersonalityEngine):
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Roommate", style="bold", width=12)
     
-    # Add columns for each roommate
+    # Resolve every roommate's style once for its header and row label
     roommate_names = list(relationships.keys())
-    for name in roommate_names:
-        color = PERSONALITY_COLORS.get(name, "white")
-        table.add_column(f"[{color}]{name[:8]}[/{color}]", width=8, justify="center")
+    default_style = CHARACTER_STYLES["_default"]
+    name_styles = [CHARACTER_STYLES.get(name, default_style) for name in roommate_names]
+    
+    # Add columns for each roommate
+    for name, style in zip(roommate_names, name_styles):
+        table.add_column(Text(name[:8], style=style), width=8, justify="center")
     
     # Add rows
-    for roommate_name in roommate_names:
-        color = PERSONALITY_COLORS.get(roommate_name, "white")
-        row = [f"[{color}]{roommate_name}[/{color}]"]
+    for roommate_name, style in zip(roommate_names, name_styles):
+        scores = relationships[roommate_name]
+        row = [Text(roommate_name, style=style)]
         
         for other_name in roommate_names:
             if roommate_name == other_name:
-                row.append("[dim]--[/dim]")
+                row.append(_SELF_CELL)
             else:
-                score = relationships[roommate_name].get(other_name, 50)
+                score = scores.get(other_name, 50)
                 if score >= 70:
-                    row.append(f"[green]{score}[/green]")
+                    row.append(Text(str(score), style=_GOOD_SCORE))
                 elif score >= 40:
-                    row.append(f"[yellow]{score}[/yellow]")
+                    row.append(Text(str(score), style=_NEUTRAL_SCORE))
                 else:
-                    row.append(f"[red]{score}[/red]")
+                    row.append(Text(str(score), style=_TENSE_SCORE))
         
         table.add_row(*row)
     
@@ -138,9 +95,10 @@ def display_relationships(engine: PersonalityEngine):
     console.print("\n[dim]Scores: [green]70+[/green] = Good friends, [yellow]40-69[/yellow] = Neutral, [red]<40[/red] = Tension[/dim]\n")
 
 
-def display_help():
-    """Display available commands."""
-    help_panel = Panel(
+@lru_cache(maxsize=1)
+def _help_panel():
+    """The help panel, built on first use and reused."""
+    return Panel(
         """[bold]Available Commands:[/bold]
 
 • [cyan]relationships[/cyan] - View roommate relationship status
@@ -156,7 +114,11 @@ The more you chat, the more their relationships evolve!""",
         title="[bold bright_cyan]Flatshare Chaos Help[/bold bright_cyan]",
         border_style="cyan"
     )
-    console.print(help_panel)
+
+
+def display_help():
+    """Display available commands."""
+    console.print(_help_panel())
 
 
 def display_stats(engine: PersonalityEngine):
@@ -186,7 +148,7 @@ def display_stats(engine: PersonalityEngine):
     
     for roommate in engine.roommates:
         count = roommate_counts.get(roommate.name, 0)
-        color = PERSONALITY_COLORS.get(roommate.name, "white")
+        color = CHARACTER_COLORS.get(roommate.name, "white")
         
         if count == 0:
             activity = "[dim]Silent[/dim]"
@@ -218,8 +180,11 @@ def main():
     roommates = create_flatshare_chaos_roommates()
     engine = PersonalityEngine(roommates, adapter)
 
+    # History and tab completion for the prompt
+    enable_line_editing(("help", "personalities", "relationships", "stats", "exit", "quit"))
+
     # Display intro
-    display_roommate_intro()
+    display_roommate_intro(engine.roommates)
 
     console.print("───────────────────────────────────────────────────────── [bold bright_cyan]Flatshare Chaos: Personality Edition[/bold bright_cyan] ─────────────────────────────────────────────────────────")
     
@@ -233,60 +198,74 @@ def main():
         if not user_msg:
             continue
             
-        # Handle special commands
-        if user_msg.lower() in {"exit", "quit"}:
+        # Handle special commands, lowercasing the message once
+        command = user_msg.lower()
+        if command in {"exit", "quit"}:
             console.print("\n[bright_cyan]Thanks for visiting the chaos! 👋[/bright_cyan]")
             break
-        elif user_msg.lower() == "relationships":
+        elif command == "relationships":
             display_relationships(engine)
             continue
-        elif user_msg.lower() == "personalities":
-            display_roommate_intro()
+        elif command == "personalities":
+            display_roommate_intro(engine.roommates)
             continue
-        elif user_msg.lower() == "stats":
+        elif command == "stats":
             display_stats(engine)
             continue
-        elif user_msg.lower() == "help":
+        elif command == "help":
             display_help()
             continue
 
         # Generate personality-driven responses
         if args.stream:
-            # Streaming with personality colors
+            # Streaming with personality colors, written straight to the
+            # console's file wrapped in precomputed ANSI codes
             current_speaker: str | None = None
-            current_style: str = PERSONALITY_COLORS["_default"]
+            # Fixed styles held in locals for the loop
+            default_style = CHARACTER_STYLES["_default"]
+            you_style = CHARACTER_STYLES["_you"]
+            current_style: Style = default_style
+            out = console.file
 
-            for chunk in engine.personality_turn_stream(user_msg):
+            for chunk in paced(engine.personality_turn_stream(user_msg), PAUSE_S):
                 # Newline indicates speaker finished
                 if chunk == "\n":
-                    console.print()
+                    out.write("\n")
+                    out.flush()
                     current_speaker = None
-                    current_style = PERSONALITY_COLORS["_default"]
-                    time.sleep(PAUSE_S)
+                    current_style = default_style
                     continue
 
                 # Detect speaker prefix
-                if chunk.endswith(": ") and ":" in chunk:
-                    speaker = chunk.split(":", 1)[0].strip()
+                # endswith only compares the last two characters, so ordinary chunks
+                # are rejected without a scan; the name is the prefix chunk minus ": "
+                if chunk.endswith(": "):
+                    speaker = chunk[:-2].strip()
                     current_speaker = speaker
                     if speaker == "You":
-                        current_style = PERSONALITY_COLORS.get("_you", "bold white")
+                        current_style = you_style
                     else:
-                        current_style = PERSONALITY_COLORS.get(speaker, PERSONALITY_COLORS["_default"])
-                    console.print(chunk, style=current_style, end="")
-                else:
-                    # Regular content chunk
-                    console.print(chunk, style=current_style, end="")
+                        current_style = CHARACTER_STYLES.get(speaker, default_style)
+
+                pre, post = ansi_codes(console, current_style)
+                out.write(pre + chunk + post)
 
-                sys.stdout.flush()
-                time.sleep(PAUSE_S)
+                # Chunks are paced for the typewriter effect, so each one has to
+                # reach the terminal before the next pause; line buffering would
+                # hold the whole line back until its newline
+                out.flush()
 
-            console.print()
+            out.write("\n")
+            out.flush()
 
         else:
-            # Non-streaming mode
+            # Non-streaming mode: the whole turn is one Text, rendered and
+            # written with a single print
             responses = engine.personality_turn(user_msg)
-            for response in responses:
+            turn_text = Text()
+            for i, response in enumerate(responses):
+                if i:
+                    turn_text.append("\n")
                 # Parse speaker and message
                 if ":" in response:
                     speaker, message = response.split(":", 1)
@@ -294,13 +273,14 @@ def main():
                     message = message.strip()
                     
                     if speaker == "You":
-                        style = PERSONALITY_COLORS.get("_you", "bold white")
+                        style = CHARACTER_STYLES["_you"]
                     else:
-                        style = PERSONALITY_COLORS.get(speaker, PERSONALITY_COLORS["_default"])
+                        style = CHARACTER_STYLES.get(speaker, CHARACTER_STYLES["_default"])
                     
-                    console.print(f"{speaker}: {message}", style=style)
+                    turn_text.append(f"{speaker}: {message}", style=style)
                 else:
-                    console.print(response)
+                    turn_text.append(response)
+            console.print(turn_text)
 
 
 if __name__ == "__main__":
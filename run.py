@@ -11,6 +11,12 @@ import os
 import signal
 import requests
 from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+# One session for all health checks, so startup polling reuses a kept-alive
+# connection to each local server instead of reconnecting every time
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
 
 def print_colored(message, color="white"):
     """Print colored messages."""
@@ -29,7 +35,7 @@ def print_colored(message, color="white"):
 def check_ollama():
     """Check if Ollama is running."""
     try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=3)
+        response = _SESSION.get("http://localhost:11434/api/tags", timeout=3)
         return response.status_code == 200
     except:
         return False
@@ -37,11 +43,24 @@ def check_ollama():
 def check_fastapi():
     """Check if FastAPI is running."""
     try:
-        response = requests.get("http://localhost:8000/health", timeout=3)
+        response = _SESSION.get("http://localhost:8000/health", timeout=3)
         return response.status_code == 200
     except:
         return False
 
+def wait_until(check, timeout):
+    """Poll check() until it passes, backing off from 50ms to 1s between tries."""
+    delay = 0.05
+    deadline = time.monotonic() + timeout
+    while True:
+        if check():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.0)
+
 def start_ollama():
     """Start Ollama server."""
     if check_ollama():
@@ -57,11 +76,9 @@ def start_ollama():
         )
         
         # Wait for Ollama to start
-        for i in range(30):
-            if check_ollama():
-                print_colored("Ollama server started", "green")
-                return process
-            time.sleep(1)
+        if wait_until(check_ollama, timeout=30):
+            print_colored("Ollama server started", "green")
+            return process
         
         print_colored("Ollama failed to start", "red")
         return None
@@ -86,11 +103,9 @@ def start_fastapi():
         ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         
         # Wait for FastAPI to start
-        for i in range(15):
-            if check_fastapi():
-                print_colored("FastAPI server started", "green")
-                return process
-            time.sleep(1)
+        if wait_until(check_fastapi, timeout=15):
+            print_colored("FastAPI server started", "green")
+            return process
         
         print_colored("FastAPI failed to start", "red")
         return None
@@ -182,10 +197,15 @@ def main():
     # Show status
     show_status()
     
-    # Keep running
+    # Keep running; the signal handlers stop the servers and exit
     try:
         while True:
-            time.sleep(1)
+            if hasattr(signal, "pause"):
+                # Sleeps until a signal arrives instead of waking every second
+                signal.pause()
+            else:
+                # Windows has no signal.pause
+                time.sleep(1)
     except KeyboardInterrupt:
         cleanup()
 
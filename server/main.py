@@ -1,11 +1,43 @@
 # server/main.py
-import os, time, asyncio, httpx
-from typing import List, Dict
-from fastapi import FastAPI
+import os, json, time, asyncio, logging, httpx
+from functools import lru_cache
+from typing import List, Dict, Tuple
+from fastapi import FastAPI, Response
 from pydantic import BaseModel
+from app.cache import LLMCache
+
+# orjson decodes and encodes faster when it is installed; the stdlib
+# json module is the fallback
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 OLLAMA_URL = os.getenv("OLLAMA_URL", "http://127.0.0.1:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.1")
+# Per-attempt read timeout starts at OLLAMA_TIMEOUT and adapts to observed
+# latency (never below OLLAMA_MIN_TIMEOUT); the last retry always gets the full
+# OLLAMA_TIMEOUT so a slow but healthy model still answers
+OLLAMA_TIMEOUT = float(os.getenv("OLLAMA_TIMEOUT", "60"))
+OLLAMA_MIN_TIMEOUT = float(os.getenv("OLLAMA_MIN_TIMEOUT", "3"))
+OLLAMA_RETRIES = int(os.getenv("OLLAMA_RETRIES", "2"))
+# Opt-in: with LLM_CACHE_TTL or LLM_CACHE_PATH set, identical prompts are answered
+# from here instead of another Ollama round-trip. Only LLM_CACHE_PATH persists it.
+LLM_CACHE = (
+    LLMCache(
+        maxsize=int(os.getenv("LLM_CACHE_SIZE", "1024")),
+        ttl=float(os.getenv("LLM_CACHE_TTL", "3600")),
+        path=os.getenv("LLM_CACHE_PATH") or None,
+    )
+    if os.getenv("LLM_CACHE_TTL") or os.getenv("LLM_CACHE_PATH")
+    else None
+)
 
 CHAR_PROMPTS: Dict[str, str] = {
     
@@ -26,8 +58,17 @@ class RoastResp(BaseModel):
     latency_ms: int
 
 app = FastAPI(title="Flatshare Chaos Backend")
+log = logging.getLogger(__name__)
 
-def build_prompt(sys: str, user_text: str, spice: int) -> str:
+# Rolling averages of successful Ollama latencies (seconds), per request kind:
+# streamed single roasts stop at their first line, while a JSON batch decodes
+# every character's roast, so one average would time batches out too early
+_latency_ewma: Dict[str, float] = {}
+
+# Everything in a prompt before the user's text depends only on the persona
+# (or cast) and spice level, so each prefix is built once and reused
+@lru_cache(maxsize=1024)
+def _prompt_prefix(sys: str, spice: int) -> str:
     return f"""{sys}
 
 Rules:
@@ -36,46 +77,203 @@ Rules:
 - Spice level: {spice} (0=mild … 5=spicy).
 - No advice; only the roast.
 
-User: {user_text}
-Roast:"""
+User: """
+
+@lru_cache(maxsize=256)
+def _batch_prompt_prefix(characters: Tuple[str, ...], spice: int) -> str:
+    personas = "\n".join(f"- {ch}: {character_prompt(ch)}" for ch in characters)
+    return f"""You write roasts for several characters at once.
+
+Characters:
+{personas}
+
+Rules:
+- One roast per character, in that character's voice.
+- 1–2 sentences each.
+- Roast (humorous jab), not harassment.
+- Spice level: {spice} (0=mild … 5=spicy).
+- No advice; only the roasts.
+
+Respond with a JSON object mapping each character name to its roast.
+
+User: """
+
+def build_prompt(sys: str, user_text: str, spice: int) -> str:
+    return _prompt_prefix(sys, spice) + user_text + "\nRoast:"
+
+def build_batch_prompt(characters: List[str], user_text: str, spice: int) -> str:
+    return _batch_prompt_prefix(tuple(characters), spice) + user_text + "\nJSON:"
+
+# Bounded, unlike storing fallbacks in CHAR_PROMPTS, since names come from requests
+@lru_cache(maxsize=256)
+def character_prompt(ch: str) -> str:
+    return CHAR_PROMPTS.get(ch, f"You are {ch}. Roast crisply; 1–2 sentences.")
 
+def first_line(text: str) -> str:
+    # One slice up to the first newline or 280 chars, without splitting every line
+    text = text.strip()
+    end = text.find("\n", 0, 280)
+    return text[:end if end >= 0 else 280]
+
+@lru_cache(maxsize=4096)
 def score_roast(text: str, spice: int) -> float:
     t = (text or "").strip()
     if not t: return 0.0
-    punc = sum(1 for c in t if c in "!?.")
+    punc = t.count("!") + t.count("?") + t.count(".")
     base = min(10.0, 3.0 + 0.02*len(t) + 0.8*punc)
     s = min(10.0, base + 0.6*spice)
     return round(s, 1)
 
+async def _cached_request(prompt: str, fmt: str | None = None) -> str:
+    if LLM_CACHE is None:
+        return await _ollama_request(prompt, fmt)
+    key = LLM_CACHE.cache_key(model=OLLAMA_MODEL, prompt=prompt, format=fmt)
+    cached = LLM_CACHE.get(key)
+    if cached is not None:
+        return cached
+    text = await _ollama_request(prompt, fmt)
+    LLM_CACHE.set(key, text)
+    return text
+
 async def ollama_generate(prompt: str) -> str:
-    async with httpx.AsyncClient(timeout=60) as client:
-        r = await client.post(f"{OLLAMA_URL}/api/generate", json={
-            "model": OLLAMA_MODEL,
-            "prompt": prompt,
-            "stream": False,
-            "options": {"temperature": 0.9, "top_p": 0.9}
-        })
+    return first_line(await _cached_request(prompt))
+
+async def ollama_generate_batch(characters: List[str], user_text: str, spice: int) -> Dict[str, str]:
+    """One request for every character's roast; returns the roasts it could parse."""
+    raw = await _cached_request(build_batch_prompt(characters, user_text, spice), fmt="json")
+    try:
+        parsed = _loads(raw)
+    except ValueError:
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+    roasts = {}
+    for ch in characters:
+        value = parsed.get(ch)
+        if isinstance(value, str) and value.strip():
+            roasts[ch] = first_line(value)
+    return roasts
+
+def _attempt_timeout(kind: str, attempt: int) -> float:
+    average = _latency_ewma.get(kind)
+    if average is None or attempt == OLLAMA_RETRIES:
+        return OLLAMA_TIMEOUT
+    # Just above the usual latency, so a hung request is retried early
+    return min(OLLAMA_TIMEOUT, max(OLLAMA_MIN_TIMEOUT, 1.5 * average))
+
+async def _post_generate(payload: dict, timeout: httpx.Timeout) -> str:
+    r = await app.state.http.post("/api/generate", content=_dumps(payload), timeout=timeout)
+    r.raise_for_status()
+    return (_loads(r.content).get("response") or "").strip()
+
+async def _stream_first_line(payload: dict, timeout: httpx.Timeout) -> str:
+    # Only a roast's first line (up to 280 chars) is kept, so read tokens as
+    # they stream and hang up once it is complete; closing the stream stops
+    # Ollama from decoding the rest
+    text = ""
+    async with app.state.http.stream("POST", "/api/generate", content=_dumps(payload), timeout=timeout) as r:
         r.raise_for_status()
-        data = r.json()
-        text = (data.get("response") or "").strip()
-        return text.split("\n")[0][:280]
+        async for line in r.aiter_lines():
+            if not line:
+                continue
+            obj = _loads(line)
+            text += obj.get("response") or ""
+            head = text.lstrip()
+            if obj.get("done") or "\n" in head or len(head) >= 280:
+                break
+    return text.strip()
+
+async def _ollama_request(prompt: str, fmt: str | None = None) -> str:
+    payload = {
+        "model": OLLAMA_MODEL,
+        "prompt": prompt,
+        # Free-form roasts stream so they can stop at the first line; JSON
+        # batches need the whole object
+        "stream": fmt is None,
+        "options": {"temperature": 0.9, "top_p": 0.9}
+    }
+    if fmt:
+        # Ollama constrains the output to valid JSON
+        payload["format"] = fmt
+    generate = _stream_first_line if payload["stream"] else _post_generate
+    kind = "stream" if payload["stream"] else f"format:{fmt}"
+    for attempt in range(OLLAMA_RETRIES + 1):
+        timeout = _attempt_timeout(kind, attempt)
+        t0 = time.monotonic()
+        try:
+            text = await generate(payload, httpx.Timeout(timeout, connect=2.0))
+        except (httpx.TimeoutException, httpx.ReadError) as e:
+            if attempt == OLLAMA_RETRIES:
+                raise
+            log.warning(
+                "Ollama attempt %d failed after %.1fs (%s), retrying",
+                attempt + 1, time.monotonic() - t0, type(e).__name__,
+            )
+            continue
+        elapsed = time.monotonic() - t0
+        average = _latency_ewma.get(kind)
+        _latency_ewma[kind] = elapsed if average is None else 0.8 * average + 0.2 * elapsed
+        if attempt:
+            log.info("Ollama answered on attempt %d in %.2fs", attempt + 1, elapsed)
+        return text
 
 @app.post("/roast", response_model=RoastResp)
 async def roast(req: RoastReq):
     t0 = time.time()
-    tasks = []
-    for ch in req.characters:
-        sys = CHAR_PROMPTS.get(ch, f"You are {ch}. Roast crisply; 1–2 sentences.")
-        tasks.append(ollama_generate(build_prompt(sys, req.text, req.spice)))
-    outs = await asyncio.gather(*tasks, return_exceptions=True)
+    batched: Dict[str, str] = {}
+    if len(req.characters) > 1:
+        # Ollama decodes requests largely one after another, so a single
+        # decode covering every character beats one request per character
+        try:
+            batched = await ollama_generate_batch(req.characters, req.text, req.spice)
+        except Exception as e:
+            log.warning("Batch roast failed (%s), falling back to one request per character", type(e).__name__)
+
+    # Characters the batch didn't cover get their own request
+    async def roast_one(ch: str):
+        try:
+            text = await ollama_generate(build_prompt(character_prompt(ch), req.text, req.spice))
+        except Exception:
+            text = "backend error, try again"
+        return ch, text
 
-    roasts: List[RoastOut] = []
-    for ch, out in zip(req.characters, outs):
-        text = "backend error, try again" if isinstance(out, Exception) else out
-        roasts.append(RoastOut(character=ch, text=text, score=score_roast(text, req.spice)))
+    scored: Dict[str, RoastOut] = {
+        ch: RoastOut(character=ch, text=text, score=score_roast(text, req.spice))
+        for ch, text in batched.items()
+    }
+    missing = [ch for ch in dict.fromkeys(req.characters) if ch not in batched]
+    # Score each roast as soon as it arrives instead of after the slowest one
+    for next_done in asyncio.as_completed([roast_one(ch) for ch in missing]):
+        ch, text = await next_done
+        scored[ch] = RoastOut(character=ch, text=text, score=score_roast(text, req.spice))
+
+    roasts: List[RoastOut] = [scored[ch] for ch in req.characters]
 
     return RoastResp(roasts=roasts, latency_ms=int((time.time()-t0)*1000))
 
+@app.on_event("startup")
+async def open_http_client():
+    # One pooled client for all Ollama calls, so a /roast's parallel character
+    # requests reuse keep-alive connections instead of each connecting anew
+    app.state.http = httpx.AsyncClient(
+        base_url=OLLAMA_URL,
+        timeout=httpx.Timeout(OLLAMA_TIMEOUT, connect=2.0),
+        headers={"Content-Type": "application/json"},
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    )
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await app.state.http.aclose()
+
+@app.on_event("shutdown")
+def save_llm_cache():
+    if LLM_CACHE is not None:
+        LLM_CACHE.save()
+
+# Pre-serialized, so startup polling skips response validation and JSON encoding
+_HEALTH_BODY = b'{"ok":true}'
+
 @app.get("/health")
-def health():
-    return {"ok": True}
+async def health():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -10,6 +10,7 @@ import sys
 import os
 import signal
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Optional
 
 class ServerManager:
@@ -17,6 +18,10 @@ class ServerManager:
         self.processes: List[subprocess.Popen] = []
         self.ollama_url = os.getenv("OLLAMA_URL", "http://127.0.0.1:11434")
         self.fastapi_port = os.getenv("FASTAPI_PORT", "8000")
+        # One session for all health checks, so polling reuses kept-alive
+        # connections to the local servers instead of reconnecting each time
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
         
     def cleanup(self, signum=None, frame=None):
         """Clean up all running processes."""
@@ -32,10 +37,32 @@ class ServerManager:
         print("?? All servers stopped.")
         sys.exit(0)
     
+    @staticmethod
+    def wait_until(check, timeout: float) -> bool:
+        """Poll check() until it passes, backing off from 50ms to 1s between tries."""
+        delay = 0.05
+        deadline = time.monotonic() + timeout
+        while True:
+            if check():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+    
+    def check_fastapi_running(self) -> bool:
+        """Check if the FastAPI server answers its health check."""
+        try:
+            response = self.session.get(f"http://localhost:{self.fastapi_port}/health", timeout=2)
+            return response.status_code == 200
+        except Exception:
+            return False
+    
     def check_ollama_running(self) -> bool:
         """Check if Ollama is already running."""
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.ollama_url}/api/tags", timeout=5)
             return response.status_code == 200
         except Exception:
             return False
@@ -56,8 +83,8 @@ class ServerManager:
                 text=True
             )
             
-            # Wait a bit for Ollama to start
-            time.sleep(3)
+            # Give Ollama up to 3s to answer, stopping early if it exits
+            self.wait_until(lambda: process.poll() is not None or self.check_ollama_running(), timeout=3)
             
             if process.poll() is None and self.check_ollama_running():
                 print("?? Ollama server started successfully")
@@ -77,7 +104,7 @@ class ServerManager:
     def check_model_available(self, model_name: str = "llama3.1") -> bool:
         """Check if the required model is available."""
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=10)
+            response = self.session.get(f"{self.ollama_url}/api/tags", timeout=10)
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 available_models = [m["name"] for m in models]
@@ -113,8 +140,8 @@ class ServerManager:
                 "--reload"
             ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
             
-            # Wait a bit for FastAPI to start
-            time.sleep(2)
+            # Give FastAPI up to 2s, stopping early once it answers or exits
+            self.wait_until(lambda: process.poll() is not None or self.check_fastapi_running(), timeout=2)
             
             if process.poll() is None:
                 print(f"?? FastAPI server started on http://localhost:{self.fastapi_port}")
@@ -132,23 +159,11 @@ class ServerManager:
         print("?? Waiting for servers to be ready...")
         
         # Wait for Ollama
-        for i in range(30):  # 30 second timeout
-            if self.check_ollama_running():
-                break
-            time.sleep(1)
-        else:
+        if not self.wait_until(self.check_ollama_running, timeout=30):
             print("??  Ollama server not responding")
         
         # Wait for FastAPI
-        for i in range(10):  # 10 second timeout
-            try:
-                response = requests.get(f"http://localhost:{self.fastapi_port}/health", timeout=2)
-                if response.status_code == 200:
-                    break
-            except Exception:
-                pass
-            time.sleep(1)
-        else:
+        if not self.wait_until(self.check_fastapi_running, timeout=10):
             print("??  FastAPI server not responding")
     
     def show_status(self):
@@ -165,7 +180,7 @@ class ServerManager:
         
         # Check FastAPI status
         try:
-            response = requests.get(f"http://localhost:{self.fastapi_port}/health", timeout=2)
+            response = self.session.get(f"http://localhost:{self.fastapi_port}/health", timeout=2)
             if response.status_code == 200:
                 print(f"?? FastAPI Server: http://localhost:{self.fastapi_port}")
             else:
@@ -181,11 +196,27 @@ class ServerManager:
         print("\n???  Press Ctrl+C to stop all servers")
         print("="*60)
     
+    def wait_for_child_exit(self):
+        """Block until a server process may have exited, without polling every second."""
+        if len(self.processes) == 1 and hasattr(os, "waitid"):
+            # Wait on that process only; WNOWAIT leaves it for Popen.poll() to reap
+            os.waitid(os.P_PID, self.processes[0].pid, os.WEXITED | os.WNOWAIT)
+        elif hasattr(signal, "pause"):
+            # Several servers: woken by SIGCHLD (see run) or by Ctrl+C; nothing
+            # is reaped here, so children we did not start are left alone
+            signal.pause()
+        else:
+            # Windows has neither
+            time.sleep(1)
+    
     def run(self):
         """Main run method."""
         # Set up signal handlers for clean shutdown
         signal.signal(signal.SIGINT, self.cleanup)
         signal.signal(signal.SIGTERM, self.cleanup)
+        if hasattr(signal, "SIGCHLD"):
+            # A no-op handler makes a server exiting interrupt signal.pause()
+            signal.signal(signal.SIGCHLD, lambda signum, frame: None)
         
         print("?? Starting Flatshare Chaos Servers...")
         
@@ -217,7 +248,7 @@ class ServerManager:
         # Keep running until interrupted
         try:
             while True:
-                time.sleep(1)
+                self.wait_for_child_exit()
                 # Check if any process died
                 for process in self.processes[:]:  # Copy list to avoid modification during iteration
                     if process.poll() is not None:
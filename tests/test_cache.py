@@ -0,0 +1,46 @@
+from app.cache import LLMCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LLMCache(maxsize=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert len(cache) == 2
+
+
+def test_expired_entry_is_a_miss():
+    cache = LLMCache(ttl=60)
+    cache.set("fresh", "kept")
+    cache.set("stale", "gone", ttl=-1)
+    assert cache.get("fresh") == "kept"
+    assert cache.get("stale") is None
+    assert len(cache) == 1
+
+
+def test_cache_key_ignores_field_order():
+    assert LLMCache.cache_key(model="m", prompt="p") == LLMCache.cache_key(prompt="p", model="m")
+    assert LLMCache.cache_key(model="m", prompt="p") != LLMCache.cache_key(model="m", prompt="q")
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "nested" / "cache.json")
+    cache = LLMCache(path=path)
+    cache.set("kept", "roast")
+    cache.set("stale", "old", ttl=-1)
+    cache.save()
+
+    restored = LLMCache(path=path)
+    assert restored.get("kept") == "roast"
+    assert restored.get("stale") is None
+    assert len(restored) == 1
+
+
+def test_unreadable_file_starts_empty(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("not json", encoding="utf-8")
+    assert len(LLMCache(path=str(path))) == 0
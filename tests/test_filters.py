@@ -0,0 +1,16 @@
+from app.safety.filters import sanitize_roast
+
+BLOCKED = "Let's keep it classy—PG-13 roast only."
+
+
+def test_dotted_capital_i_is_still_filtered():
+    for text in ("RELİGİON talk", "ETHNİC", "DİSAB"):
+        assert sanitize_roast(text) == BLOCKED
+
+
+def test_dotless_i_is_still_filtered():
+    assert sanitize_roast("relıgıon") == BLOCKED
+
+
+def test_clean_roast_passes_through():
+    assert sanitize_roast("  Your code has more bugs than a rainforest.  ") == "Your code has more bugs than a rainforest."
@@ -0,0 +1,35 @@
+import random
+
+from app.relationship_engine import RelationshipEngine
+
+
+def _expected(engine, name, reverse):
+    # What a stable sort of the plain scores gives, ties in first-write order
+    scores = engine.get_all_relationships(name)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=reverse)
+
+
+def test_rankings_follow_score_changes():
+    rng = random.Random(7)
+    names = ["Alice", "Bob", "Cara", "Dev", "Eli", "Fay"]
+    engine = RelationshipEngine()
+    for _ in range(500):
+        first, second = rng.sample(names, 2)
+        if rng.random() < 0.1:
+            engine.reset_relationship(first, second)
+        else:
+            engine.update_relationship(first, second, rng.randint(-30, 30))
+    for name in names:
+        assert engine.get_strongest_relationships(name, limit=10) == _expected(engine, name, True)
+        assert engine.get_weakest_relationships(name, limit=10) == _expected(engine, name, False)
+
+
+def test_rankings_are_limited_and_mirrored():
+    engine = RelationshipEngine()
+    engine.update_relationship("Alice", "Bob", 30)
+    engine.update_relationship("Alice", "Cara", -30)
+    engine.update_relationship("Dev", "Alice", 10)
+    assert engine.get_strongest_relationships("Alice", limit=2) == [("Bob", 80), ("Dev", 60)]
+    assert engine.get_weakest_relationships("Alice", limit=1) == [("Cara", 20)]
+    assert engine.get_strongest_relationships("Bob") == [("Alice", 80)]
+    assert engine.get_strongest_relationships("Nobody") == []
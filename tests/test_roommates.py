@@ -0,0 +1,70 @@
+import copy
+
+import pytest
+
+from app.roommates import RelationshipScores
+
+CAST = ("Alice", "Bob", "Cara")
+
+
+def test_behaves_like_a_dict():
+    scores = RelationshipScores(CAST)
+    assert len(scores) == 0
+    scores["Bob"] = 70
+    scores["Alice"] = 20
+    assert scores["Bob"] == 70
+    assert "Cara" not in scores
+    assert list(scores) == ["Alice", "Bob"]
+    assert dict(scores) == {"Alice": 20, "Bob": 70}
+    del scores["Alice"]
+    assert dict(scores) == {"Bob": 70}
+    with pytest.raises(KeyError):
+        scores["Alice"]
+    with pytest.raises(KeyError):
+        del scores["Alice"]
+
+
+def test_fill_and_names_outside_the_cast():
+    scores = RelationshipScores(CAST, fill=50)
+    assert dict(scores) == {"Alice": 50, "Bob": 50, "Cara": 50}
+    scores["Stranger"] = 0
+    assert scores["Stranger"] == 0
+    assert len(scores) == 4
+    del scores["Stranger"]
+    assert "Stranger" not in scores
+
+
+def test_copies_do_not_share_scores():
+    scores = RelationshipScores(CAST, fill=50)
+    scores["Extra"] = 10
+    for clone in (copy.copy(scores), copy.deepcopy(scores)):
+        clone["Alice"] = 99
+        clone["Extra"] = 11
+        assert scores["Alice"] == 50
+        assert scores["Extra"] == 10
+    assert scores.copy() == dict(scores)
+
+
+@pytest.mark.parametrize("score", [-1, 101, 128])
+def test_out_of_range_scores_are_rejected(score):
+    scores = RelationshipScores(CAST)
+    with pytest.raises(ValueError):
+        scores["Alice"] = score
+    with pytest.raises(ValueError):
+        RelationshipScores(CAST, fill=score)
+    assert "Alice" not in scores
+
+
+@pytest.mark.parametrize("score", [50.0, "50", True, None])
+def test_non_int_scores_are_rejected(score):
+    scores = RelationshipScores(CAST)
+    with pytest.raises(TypeError):
+        scores["Alice"] = score
+    assert "Alice" not in scores
+
+
+def test_bounds_are_accepted():
+    scores = RelationshipScores(CAST)
+    scores["Alice"] = 0
+    scores["Bob"] = 100
+    assert dict(scores) == {"Alice": 0, "Bob": 100}